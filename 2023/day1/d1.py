@@ -1,15 +1,70 @@
+from pathlib import Path
 import re
-with open('./d1p1.txt') as f:
-    data = f.readlines()
+import sys
 
-data = [val.strip() for val in data]
-data = [val.replace(
-    'one', 'one1one').replace('two', 'two2two').replace('three', 'three3three').replace(
-        'four', 'four4four').replace('five', 'five5five').replace('six', 'six6six').replace(
-            'seven', 'seven7seven').replace('eight', 'eight8eight').replace('nine', 'nine9nine')
-            for val in data]
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.parsing import line_chunks
 
-numbers_found = [re.findall('\d' ,x) for x in data]
-print(sum([int(numbers[0] + numbers[-1]) for numbers in numbers_found]))
+WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+DIGIT_VALUES = {word.encode(): i + 1 for i, word in enumerate(WORDS)}
+DIGIT_VALUES.update({str(i).encode(): i for i in range(10)})
 
+# leftmost match of the forward pattern is the first digit, leftmost match of
+# the reversed pattern on the reversed line is the last one. Scanning from
+# each end separately is what makes overlaps like 'eightwo' come out right.
+FORWARD = re.compile(rb'\d|' + b'|'.join(word.encode() for word in WORDS))
+BACKWARD = re.compile(rb'\d|' + b'|'.join(word[::-1].encode() for word in WORDS))
+DIGITS_ONLY = re.compile(rb'\d')
 
+# whole-buffer versions, one findall per pattern walks every line in C: the
+# lazy prefix stops at the first match of a line, the greedy one backtracks
+# to the last. Lines without a match are skipped by both, so they stay paired.
+_ALTERNATION = FORWARD.pattern
+FIRST_PER_LINE = {True: re.compile(rb'^[^\n]*?(' + _ALTERNATION + rb')', re.M),
+                  False: re.compile(rb'^[^\n]*?(\d)', re.M)}
+LAST_PER_LINE = {True: re.compile(rb'^.*(' + _ALTERNATION + rb')', re.M),
+                 False: re.compile(rb'^.*(\d)', re.M)}
+
+
+def calibration_value(line: bytes, words: bool = True) -> int:
+    '''First and last digit (or digit word) of the line, 0 if there is none'''
+    forward, backward = (FORWARD, BACKWARD) if words else (DIGITS_ONLY, DIGITS_ONLY)
+    first = forward.search(line)
+    if first is None:
+        return 0
+    last = backward.search(line[::-1])
+    return 10 * DIGIT_VALUES[first.group()] + DIGIT_VALUES[last.group()[::-1]]
+
+
+def calibration_sum(buffer: bytes, words: bool = True) -> int:
+    '''Sum of calibration_value over every line of the buffer'''
+    firsts = FIRST_PER_LINE[words].findall(buffer)
+    lasts = LAST_PER_LINE[words].findall(buffer)
+    return 10 * sum(map(DIGIT_VALUES.__getitem__, firsts)) + sum(map(DIGIT_VALUES.__getitem__, lasts))
+
+
+def calibration_sum_file(path, words: bool = True, chunk_size: int = 1 << 24) -> int:
+    '''calibration_sum over a file read in chunks cut at line boundaries'''
+    with open(path, 'rb') as f:
+        return sum(calibration_sum(chunk, words) for chunk in line_chunks(f, chunk_size))
+
+
+def calibration_sum_replace(data) -> int:
+    '''The original approach: rewrite every word with str.replace, then findall'''
+    data = [val.strip() for val in data]
+    data = [val.replace(
+        'one', 'one1one').replace('two', 'two2two').replace('three', 'three3three').replace(
+            'four', 'four4four').replace('five', 'five5five').replace('six', 'six6six').replace(
+                'seven', 'seven7seven').replace('eight', 'eight8eight').replace('nine', 'nine9nine')
+                for val in data]
+
+    numbers_found = [re.findall(r'\d' ,x) for x in data]
+    return sum([int(numbers[0] + numbers[-1]) for numbers in numbers_found])
+
+
+if __name__ == '__main__':
+    with open('./d1p1.txt') as f:
+        data = f.readlines()
+
+    print(calibration_sum_replace(data))
+    print(calibration_sum_file('./d1p1.txt'))
@@ -17,4 +17,9 @@ total_power=0
 for current_game in data:
     total_power += current_game.calculate_power()
 
-print(total_power)
\ No newline at end of file
+print(total_power)
+
+# columnar parse, both parts in one go
+game_ids, maxima = load_games('./d2.txt')
+print(possible_games_sum(game_ids, maxima))
+print(power_sum(maxima))
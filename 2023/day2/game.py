@@ -1,15 +1,98 @@
-from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
 import re
 import math
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import lazy_import
+from aoc.parsing import digit_runs, line_chunks
+
+np = lazy_import('numpy')
  
 CONFIGURATION = {
     'green': 13, 'red': 12, 'blue': 14
 }
 
+# columnar parsing, column order of the max-per-colour array
+COLORS = tuple(CONFIGURATION)
+
+
+@cache
+def color_tables():
+    '''(limits, words) arrays, built on first use so the Game path never imports NumPy.
+
+    limits follows COLORS order, words holds each colour name as uint8 bytes
+    for match_colors.
+    '''
+    limits = np.array([CONFIGURATION[color] for color in COLORS], dtype=np.int64)
+    words = [np.frombuffer(color.encode(), dtype=np.uint8) for color in COLORS]
+    return limits, words
+
+
+def match_colors(buf, starts):
+    '''Column of the colour word starting at each offset, -1 for colours we do not track.
+
+    The whole word has to match and be followed by a non-letter, so
+    'rabbits' or 'reddish' is not red. buf must extend at least one byte
+    past the longest colour name after every start.
+    '''
+    codes = np.full(len(starts), -1, dtype=np.int64)
+    for i, word in enumerate(color_tables()[1]):
+        matched = (buf[starts[:, None] + np.arange(len(word))] == word).all(axis=1)
+        after = buf[starts + len(word)] | 0x20  # lower-cases ASCII letters
+        matched &= (after < ord('a')) | (after > ord('z'))
+        codes[matched] = i
+    return codes
+
+
+def parse_games(data: bytes):
+    '''Parse game records straight into columns, no Game/Turn objects.
+
+    Every run of digits in the buffer is a number: followed by ':' it is a
+    game id, followed by ' <colour>' it is a cube count for the current game.
+    Returns (game_ids, maxima) where maxima has shape (games, len(COLORS))
+    and holds the largest count of each colour seen in any turn of the game
+    (0 if the colour never shows up).
+    '''
+    # padding so a colour word can be compared past the end of the data
+    buf = np.frombuffer(data + b'\n' * (max(map(len, COLORS)) + 2), dtype=np.uint8)
+    _, run_ends, values = digit_runs(buf)
+
+    is_id = buf[run_ends] == ord(':')
+    colors = match_colors(buf, run_ends + 1)
+    game_idx = np.cumsum(is_id) - 1
+    cubes = ~is_id & (buf[run_ends] == ord(' ')) & (colors >= 0)
+    if (game_idx[cubes] < 0).any():
+        raise ValueError('Cube count before the first game id')
+
+    maxima = np.zeros((int(is_id.sum()), len(COLORS)), dtype=np.int64)
+    np.maximum.at(maxima, (game_idx[cubes], colors[cubes]), values[cubes])
+    return values[is_id], maxima
+
+
+def load_games(file_path, chunk_size: int = 1 << 22):
+    '''parse_games over a file read in chunks cut at line boundaries'''
+    with open(file_path, 'rb') as f:
+        parsed = [parse_games(chunk) for chunk in line_chunks(f, chunk_size)] or [parse_games(b'')]
+    return np.concatenate([ids for ids, _ in parsed]), np.concatenate([maxima for _, maxima in parsed])
+
+
+def possible_games_sum(game_ids, maxima) -> int:
+    '''Part 1: ids of the games that never exceed CONFIGURATION'''
+    return int(game_ids[(maxima <= color_tables()[0]).all(axis=1)].sum())
+
+
+def power_sum(maxima) -> int:
+    '''Part 2: sum over games of the product of the per-colour maxima'''
+    return int(maxima.prod(axis=1).sum())
+
 class Game:
+    __slots__ = ('game_id', 'turns')
+
     def __init__(self, current_game_data) -> None:
         game, turn_info = current_game_data.strip().split(":")
-        x = re.findall('\d', game)
+        x = re.findall(r'\d', game)
         x = int(''.join(x))
         self.game_id = x
         turns = turn_info.split(';')
@@ -39,6 +122,8 @@ class Game:
         return power
 
 class Turn:
+    __slots__ = ('colors',)
+
     def __init__(self, turn_info) -> None:
         colors_info = turn_info.split(',')
         self.colors = dict()
@@ -0,0 +1,64 @@
+import re
+from array import array
+from math import prod
+
+NUMBER = re.compile(r'\d+')
+SYMBOL = re.compile(r'[^\d.\s]')
+NEIGHBOURS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+class Schematic:
+    '''Engine schematic indexed in one pass.
+
+    Every number span gets an id and every cell it covers is labelled with
+    that id in a flat label grid (-1 elsewhere), so a symbol finds its
+    neighbouring numbers with 8 lookups instead of rescanning rows. Equal
+    numbers keep separate ids.
+    '''
+
+    def __init__(self, lines) -> None:
+        self.rows = [line.rstrip('\r\n') for line in lines]
+        self.rows = [row for row in self.rows if row]
+        self.height = len(self.rows)
+        self.width = max((len(row) for row in self.rows), default=0)
+        self.labels = array('i', [-1]) * (self.height * self.width)
+        self.numbers = list()
+        self.symbols = list()
+        for i, row in enumerate(self.rows):
+            for match in NUMBER.finditer(row):
+                number_id = len(self.numbers)
+                self.numbers.append(int(match.group()))
+                base = i * self.width
+                for j in range(match.start(), match.end()):
+                    self.labels[base + j] = number_id
+            for match in SYMBOL.finditer(row):
+                self.symbols.append((i, match.start(), match.group()))
+
+    def neighbour_ids(self, i: int, j: int) -> set:
+        '''ids of the numbers touching cell (i, j), diagonals included'''
+        found = set()
+        for di, dj in NEIGHBOURS:
+            x, y = i + di, j + dj
+            if 0 <= x < self.height and 0 <= y < self.width:
+                number_id = self.labels[x * self.width + y]
+                if number_id >= 0:
+                    found.add(number_id)
+        return found
+
+    def part_number_sum(self) -> int:
+        '''Sum of every number adjacent to at least one symbol, each counted once'''
+        part_ids = set()
+        for i, j, _ in self.symbols:
+            part_ids |= self.neighbour_ids(i, j)
+        return sum(self.numbers[number_id] for number_id in part_ids)
+
+    def gear_ratio_sum(self) -> int:
+        '''Sum over '*' symbols touching exactly two numbers of their product'''
+        total = 0
+        for i, j, symbol in self.symbols:
+            if symbol != '*':
+                continue
+            ids = self.neighbour_ids(i, j)
+            if len(ids) == 2:
+                total += prod(self.numbers[number_id] for number_id in ids)
+        return total
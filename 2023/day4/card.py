@@ -1,20 +1,41 @@
+from __future__ import annotations
+
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import lazy_import
+from aoc.parsing import digit_runs
+
+np = lazy_import('numpy')
+
+NUMBER = re.compile(r'\d+')
+
+# widest number-indexed row deck_matches builds, past it a card's numbers
+# are matched with a set instead (puzzle numbers are < 100)
+MATRIX_WIDTH_LIMIT = 1024
+
+
 class Card:
+    __slots__ = ('card_num', 'jeete', 'mere_patte', 'matches')
+
     def __init__(self, row):
         card_num, patte = row.split(':')
-        self.card_num = int(re.findall(r'\d+', card_num)[0])
+        self.card_num = int(NUMBER.search(card_num).group())
         jeete, mere_patte = patte.strip().split('|')
-        self.jeete = re.findall(r'\d+', jeete)
-        self.mere_patte = re.findall(r'\d+', mere_patte)
+        self.jeete = [int(x) for x in NUMBER.findall(jeete)]
+        self.mere_patte = [int(x) for x in NUMBER.findall(mere_patte)]
         self.matches=0
-        
+
     def __repr__(self):
         return f'Winning cards: {self.jeete}\nMy cards: {self.mere_patte}'
-    
+
     def calculate_points(self):
+        winning = set(self.jeete)
         matches=0
         for my_card in self.mere_patte:
-            if my_card in self.jeete:
+            if my_card in winning:
                 matches+=1
         self.matches = matches
         return matches
@@ -25,3 +46,80 @@ class Card:
             return 0
         else:
             return 2 ** (matches-1)
+
+
+def deck_matches(data: bytes) -> np.ndarray:
+    '''Number of matches of every card in a deck, without Card objects.
+
+    Each card becomes a row of a boolean matrix indexed by number (the numbers
+    are small, < 100 in the puzzle), so the whole deck is one parse, two
+    scatters and one row-wise reduction. Repeats among my numbers count once
+    per repeat, like calculate_points. A number of MATRIX_WIDTH_LIMIT or more
+    would make the matrix too wide, such a deck goes through set_matches.
+    '''
+    buf = np.frombuffer(data + b'\n', dtype=np.uint8)
+    _, run_ends, values = digit_runs(buf)
+    is_card = buf[run_ends] == ord(':')
+    card_idx = np.cumsum(is_card) - 1
+    if len(card_idx) and card_idx[0] < 0:
+        raise ValueError('Number before the first card header')
+
+    # numbers after the card's '|' are mine
+    bars_seen = np.cumsum(buf == ord('|'))[run_ends]
+    bars_at_card = bars_seen[is_card][card_idx]
+    mine = ~is_card & (bars_seen > bars_at_card)
+    winning = ~is_card & ~mine
+
+    cards = int(is_card.sum())
+    width = int(values[~is_card].max()) + 1 if (~is_card).any() else 1
+    if width > MATRIX_WIDTH_LIMIT:
+        return set_matches(cards, card_idx[winning], values[winning], card_idx[mine], values[mine])
+    winning_matrix = np.zeros((cards, width), dtype=bool)
+    winning_matrix[card_idx[winning], values[winning]] = True
+    # a card's own numbers are matched against its own winning row
+    return np.bincount(card_idx[mine], weights=winning_matrix[card_idx[mine], values[mine]],
+                       minlength=cards).astype(np.int64)
+
+
+def set_matches(cards: int, winning_cards, winning_values, my_cards, my_values) -> np.ndarray:
+    '''deck_matches for any number size: one set of winning numbers per card'''
+    winning = [set() for _ in range(cards)]
+    for card_index, value in zip(winning_cards.tolist(), winning_values.tolist()):
+        winning[card_index].add(value)
+    matches = [0] * cards
+    for card_index, value in zip(my_cards.tolist(), my_values.tolist()):
+        matches[card_index] += value in winning[card_index]
+    return np.array(matches, dtype=np.int64)
+
+
+def load_deck(file_path) -> np.ndarray:
+    with open(file_path, 'rb') as f:
+        return deck_matches(f.read())
+
+
+def deck_score(matches: np.ndarray) -> int:
+    '''Part 1 from the per-card match counts'''
+    scoring = matches[matches > 0]
+    return int((np.int64(1) << (scoring - 1)).sum())
+
+
+def total_copies(matches) -> int:
+    '''Part 2: total cards once every win has handed out its copies.
+
+    Card i adds its copy count to the whole span of the next matches[i]
+    cards, recorded in O(1) as +copies/-copies in a difference array; the
+    running prefix sum is the number of extra copies of the current card.
+    Spans running past the end of the deck are clamped.
+    '''
+    matches = matches.tolist() if hasattr(matches, 'tolist') else list(matches)
+    n = len(matches)
+    diff = [0] * (n + 1)
+    running, total = 0, 0
+    for i, card_matches in enumerate(matches):
+        running += diff[i]
+        copies = 1 + running
+        total += copies
+        if card_matches:
+            diff[i + 1] += copies
+            diff[min(i + 1 + card_matches, n)] -= copies
+    return total
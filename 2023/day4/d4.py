@@ -9,9 +9,4 @@ cards = [Card(x) for x in data]
 points = [card.calculate_score() for card in cards]
 print(f'Part 1: {sum(points)}')
 
-cards_found = [1 for _ in range(len(cards))]
-for i, card in enumerate(cards):
-    for j in range(card.matches):
-        cards_found[i+j+1]+=cards_found[i]
-
-print(f'Part 2: {sum(cards_found)}')
\ No newline at end of file
+print(f'Part 2: {total_copies([card.matches for card in cards])}')
\ No newline at end of file
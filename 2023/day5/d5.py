@@ -1,60 +1,179 @@
-from typing import Iterable, List
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Tuple
+from bisect import bisect_right
 from dataclasses import dataclass
-from time import time
 from pathlib import Path
-from tqdm import tqdm
 import re
+import sys
 
 ROOT = Path(__file__).parent
+sys.path.append(str(ROOT.resolve().parents[1]))
+from aoc.instrument import counted, phase
+from aoc.lazy import lazy_import
+
+# only the batch path needs NumPy (and only the brute-force cross-check
+# needs tqdm and multiprocessing), keep them out of the import
+np = lazy_import('numpy')
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Node:
     source_start: int
     source_end: int
     destination_start: int
     destination_end: int
 
+
+def node_from_triple(destination_start: int, source_start: int, range: int) -> Node:
+    return Node(source_start, source_start + range - 1, destination_start, destination_start + range - 1)
+
 class Mapping:
     def __init__(self, starter_list: List) -> None:
         self.name = starter_list[0]
         self.nodes = [self.process_node_string(x) for x in starter_list[1:]]
+        self.sort_mapping()
+
+    @classmethod
+    def from_triples(cls, name: str, triples: Iterable) -> Mapping:
+        '''Mapping from (destination_start, source_start, length) rows, the
+        numbers of the text lines, e.g. an (n, 3) int64 array'''
+        mapping = cls([name])
+        mapping.nodes = [node_from_triple(*map(int, row)) for row in triples]
+        mapping.sort_mapping()
+        return mapping
+
+    def triples(self) -> List[Tuple[int, int, int]]:
+        return [(node.destination_start, node.source_start, node.source_end - node.source_start + 1)
+                for node in self.nodes]
 
     def process_node_string(self, node_string: str) -> Iterable:
         destination_start, source_start, range = [int(x.strip()) for x in node_string.split(" ")]
-        source_end = source_start + range - 1
-        destination_end = destination_start + range - 1
-        return Node(source_start, source_end, destination_start, destination_end)        
+        return node_from_triple(destination_start, source_start, range)
 
+    @counted
     def find_mapping(self, source_num: int) -> int:
+        i = bisect_right(self.starts, source_num) - 1
+        return source_num if i < 0 else source_num + self.offsets[i]
+
+    @counted
+    def find_mapping_batch(self, source_nums: np.ndarray) -> np.ndarray:
+        '''Vectorised find_mapping for an int64 array, one searchsorted per call'''
+        starts, offsets = self.index_arrays()
+        return source_nums + offsets[np.searchsorted(starts, source_nums, side='right')]
+
+    def index_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        '''starts/offsets as int64 arrays, offsets gets a leading identity entry
+        for anything left of the first segment so the searchsorted result can
+        index it directly'''
+        if self._index_arrays is None:
+            self._index_arrays = (np.array(self.starts, dtype=np.int64),
+                                  np.array([0] + self.offsets, dtype=np.int64))
+        return self._index_arrays
+
+    def segments(self, start: int, end: int | None) -> Iterator[Tuple[int, int, int]]:
+        '''Yield (piece_start, piece_end, offset) for the pieces of [start, end].
+
+        end=None means the interval is open to the right, the last piece then
+        also has piece_end=None.
+        '''
+        i = max(bisect_right(self.starts, start) - 1, 0)
+        while end is None or start <= end:
+            next_start = self.starts[i + 1] if i + 1 < len(self.starts) else None
+            if next_start is None:
+                yield start, end, self.offsets[i]
+                return
+            piece_end = next_start - 1 if end is None else min(end, next_start - 1)
+            yield start, piece_end, self.offsets[i]
+            start = piece_end + 1
+            i += 1
+
+    def map_intervals(self, intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        '''Map inclusive (start, end) intervals, splitting them at node boundaries.
+
+        Every piece is shifted as a whole, so the cost depends on the number of
+        pieces and not on how many seeds they hold.
+        '''
+        mapped = list()
+        for start, end in intervals:
+            for piece_start, piece_end, offset in self.segments(start, end):
+                mapped.append((piece_start + offset, piece_end + offset))
+        return mapped
+
+    def sort_mapping(self) -> None:
+        '''Sort the nodes by source_start and build the bisect index.
+
+        starts/offsets describe segments covering [0, inf), gaps between nodes
+        are stored as identity segments (offset 0) so every lookup is a single
+        bisect.
+        '''
+        self.nodes.sort(key=lambda node: node.source_start)
+        self.starts, self.offsets = [0], [0]
+        self._index_arrays = None
+        cursor = 0
         for node in self.nodes:
-            if source_num >= node.source_start and source_num <= node.source_end:
-                diff = source_num - node.source_start
-                return node.destination_start + diff
-        return source_num
+            if node.source_end < cursor:
+                continue
+            node_start = max(node.source_start, cursor)
+            if node_start > cursor:
+                self._add_segment(cursor, 0)
+            self._add_segment(node_start, node.destination_start - node.source_start)
+            cursor = node.source_end + 1
+        self._add_segment(cursor, 0)
 
-    def sort_mapping(self, key) -> None:
-        pass
+    def _add_segment(self, start: int, offset: int) -> None:
+        if self.starts[-1] == start:
+            self.starts.pop()
+            self.offsets.pop()
+        if self.offsets and self.offsets[-1] == offset:
+            return
+        self.starts.append(start)
+        self.offsets.append(offset)
 
     def __repr__(self) -> str:
         return f'{self.name}: {self.nodes}'
 
-# def seeds_p2(num_list: str) -> List:
-#     seeds_contenders = [int(x) for x in num_list.split(':')[1].strip().split(' ')]
-#     seeds = list()
-#     for i in range(0, len(seeds_contenders), 2):
-#         start = seeds_contenders[i]
-#         num_range = seeds_contenders[i+1]
-#         temp_list = [i for i in range(start, start+num_range)]
-#         seeds.extend(temp_list)
-#     # print(seeds)
-#     return seeds
-
-def seeds_p2(num_list: str) -> List:
-    seeds_contenders = [int(x) for x in num_list.split(':')[1].strip().split(' ')]
-    seeds = []
-    for start, num_range in tqdm(zip(seeds_contenders[::2], seeds_contenders[1::2])):
-        seeds.extend(range(start, start + num_range))
-    return seeds
+
+def compose_mappings(mapping_list: List[Mapping], name: str = 'seed-to-location map:') -> Mapping:
+    '''Fold the whole chain into one piecewise-linear Mapping.
+
+    Built once, after that a seed -> location lookup is a single bisect
+    instead of one lookup per stage.
+    '''
+    starts, offsets = [0], [0]
+    for mapping_object in mapping_list:
+        new_starts, new_offsets = list(), list()
+        for i, (start, offset) in enumerate(zip(starts, offsets)):
+            end = starts[i + 1] - 1 if i + 1 < len(starts) else None
+            image_end = None if end is None else end + offset
+            for piece_start, _, piece_offset in mapping_object.segments(start + offset, image_end):
+                total = offset + piece_offset
+                if new_offsets and new_offsets[-1] == total:
+                    continue
+                new_starts.append(piece_start - offset)
+                new_offsets.append(total)
+        starts, offsets = new_starts, new_offsets
+
+    composed = Mapping([name])
+    for i, (start, offset) in enumerate(zip(starts, offsets)):
+        if offset == 0:
+            continue
+        # the last segment is always identity, so every non-identity one is bounded
+        end = starts[i + 1] - 1
+        composed.nodes.append(Node(start, end, start + offset, end + offset))
+    composed.sort_mapping()
+    return composed
+
+
+def seed_ranges(num_list: str) -> List[Tuple[int, int]]:
+    '''Part 2 seeds as inclusive (start, end) intervals, without expanding them'''
+    return seed_pairs([int(x) for x in num_list.split(':')[1].strip().split(' ')])
+
+
+def seed_pairs(seeds_contenders: List[int]) -> List[Tuple[int, int]]:
+    '''(start, length) pairs of the seeds line as inclusive (start, end) intervals'''
+    return [(start, start + num_range - 1)
+            for start, num_range in zip(seeds_contenders[::2], seeds_contenders[1::2])
+            if num_range > 0]
 
 
 def read_file(file_path: str):
@@ -63,7 +182,7 @@ def read_file(file_path: str):
     data = [x.strip() for x in data]
 
     mapping_objects = list()
-    new_seeds = seeds_p2(data[0])
+    new_seeds = seed_ranges(data[0])
     seeds = [int(x) for x in data[0].split(':')[1].strip().split(' ')]
     other = data[2:]
     start = 0
@@ -84,24 +203,100 @@ def play_game(seed_number, mapping_list):
     return seed_number
 
 
+def play_game_batch(seeds: np.ndarray, mapping_list) -> np.ndarray:
+    '''Batch version of play_game, each stage is one vectorised pass over the array.
+
+    play_game stays the scalar reference to cross-check against. For the
+    fastest path pass [compose_mappings(mapping_list)] so there is one stage.
+    '''
+    locations = np.asarray(seeds, dtype=np.int64)
+    for mapping_object in mapping_list:
+        locations = mapping_object.find_mapping_batch(locations)
+    return locations
+
+
+def play_game_ranges(intervals, mapping_list):
+    '''Push whole seed intervals through every mapping, returns the location intervals'''
+    for mapping_object in mapping_list:
+        intervals = mapping_object.map_intervals(intervals)
+    return intervals
+
+
+def seed_chunks(intervals, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    '''Split inclusive seed intervals into inclusive chunks of at most chunk_size seeds'''
+    for start, end in intervals:
+        while start <= end:
+            chunk_end = min(end, start + chunk_size - 1)
+            yield start, chunk_end
+            start = chunk_end + 1
+
+
+# set once per worker by the pool initializer, so the mappings are not
+# pickled again with every chunk
+_worker_mappings = None
+
+def _init_worker(mapping_list) -> None:
+    global _worker_mappings
+    _worker_mappings = mapping_list
+
+def _min_location_in_chunk(chunk: Tuple[int, int]) -> Tuple[int, int]:
+    start, end = chunk
+    running_min = None
+    for seed_number in range(start, end + 1):
+        location = play_game(seed_number, _worker_mappings)
+        if running_min is None or location < running_min:
+            running_min = location
+    return running_min, end - start + 1
+
+
+def brute_force_min(intervals, mapping_list, chunk_size: int = 1_000_000, processes: int | None = None) -> int:
+    '''Check every seed one by one, streamed in chunks across a process pool.
+
+    Only meant to cross-check play_game_ranges. Memory stays constant however
+    big the ranges are, each worker only keeps a running minimum.
+    '''
+    from multiprocessing import Pool
+    from tqdm import tqdm
+
+    total = sum(end - start + 1 for start, end in intervals)
+    best = None
+    with Pool(processes, initializer=_init_worker, initargs=(mapping_list,)) as pool:
+        with tqdm(total=total, unit='seed', unit_scale=True) as progress:
+            for chunk_min, chunk_len in pool.imap_unordered(_min_location_in_chunk, seed_chunks(intervals, chunk_size)):
+                if best is None or chunk_min < best:
+                    best = chunk_min
+                progress.update(chunk_len)
+    return best
+
+
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Advent of Code 2023 Day 5")
+    parser.add_argument("path", nargs="?", default=ROOT / 'd5.txt', help="Path to almanac file (default: d5.txt next to this script)")
+    parser.add_argument("--brute-force", action="store_true", help="Also check part 2 seed by seed on a process pool")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000, help="Seeds per brute-force chunk")
+    parser.add_argument("--processes", type=int, default=None, help="Brute-force worker count (default: all cores)")
+    args = parser.parse_args()
 
     print('Making seeds')
     # start=time.time()
-    new_seeds, seeds, mapping_list = read_file(ROOT / 'd5.txt')
+    with phase('parse'):
+        new_seeds, seeds, mapping_list = read_file(args.path)
+        seed_to_location = compose_mappings(mapping_list)
 
     print('Trying to solve part 1:')
-    locations = list()
-    for seed_number in tqdm(seeds):
-        location = play_game(seed_number, mapping_list)
-        # print(f'Location for {seed_number} is {location}')
-        locations.append(location)
-    print(f'Final answer part 1: {min(locations)}')
+    with phase('part 1'):
+        locations = seed_to_location.find_mapping_batch(np.array(seeds, dtype=np.int64))
+    print(f'Final answer part 1: {locations.min()}')
 
     print('Now trying to solve part 2:')
-    locations = list()
-    for seed_number in tqdm(new_seeds):
-        location = play_game(seed_number, mapping_list)
-        # print(f'Location for {seed_number} is {location}')
-        locations.append(location)
-    print(f'Final answer part 2: {min(locations)}')
\ No newline at end of file
+    with phase('part 2'):
+        location_ranges = seed_to_location.map_intervals(new_seeds)
+    print(f'Final answer part 2: {min(start for start, _ in location_ranges)}')
+
+    if args.brute_force:
+        print('Brute forcing part 2:')
+        with phase('brute force'):
+            best = brute_force_min(new_seeds, mapping_list, args.chunk_size, args.processes)
+        print(f'Brute force answer part 2: {best}')
@@ -1,7 +1,35 @@
+from __future__ import annotations
+
+import sys
+import time
+from functools import cache
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterator, List, Tuple
 from move import Move
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import lazy_import
+from aoc.parsing import line_chunks, powers_of_10
+
+np = lazy_import("numpy")
+
+DIAL_SIZE = 100
+START_POSITION = 50
+
+# byte classes for parse_signed_moves
+_INVALID, _SPACE, _DIGIT, _DIRECTION = 0, 1, 2, 3
+
+
+@cache
+def _byte_kind() -> np.ndarray:
+    """Byte value -> class lookup table, built on first use so the Move path never imports NumPy."""
+    kind = np.zeros(256, dtype=np.uint8)
+    kind[list(b" \t\r\n")] = _SPACE
+    kind[list(b"0123456789")] = _DIGIT
+    kind[list(b"LR")] = _DIRECTION
+    return kind
+
+
 def load_moves(path: str | Path) -> List[Move]:
     """Load moves from a file where each line is like 'L68' or 'R30'.
 
@@ -27,6 +55,72 @@ def load_moves(path: str | Path) -> List[Move]:
             moves.append(Move(direction=direction, move=distance))
     return moves
 
+def load_signed_moves(path: str | Path) -> np.ndarray:
+    """Load moves as a signed int64 array, R is positive and L negative.
+
+    The file is parsed byte-wise with NumPy, no Move object (or even a str)
+    is created per line.
+    """
+    return parse_signed_moves(Path(path).read_bytes())
+
+
+def parse_signed_moves(data: bytes) -> np.ndarray:
+    """Parse b'L68\nR30...' into signed distances.
+
+    Every digit is weighted by its power of ten within its line and the
+    weights are summed per line with reduceat.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    kind = _byte_kind()[buf]
+    if (kind == _INVALID).any():
+        bad = int(np.argmax(kind == _INVALID))
+        raise ValueError(f"Invalid move character {data[bad:bad + 1]!r} at byte {bad}")
+    is_direction = kind == _DIRECTION
+    is_digit = kind == _DIGIT
+
+    direction_pos = np.flatnonzero(is_direction)
+    digit_pos = np.flatnonzero(is_digit)
+    if not len(direction_pos):
+        if len(digit_pos):
+            raise ValueError("Move distance without a direction")
+        return np.zeros(0, dtype=np.int64)
+    if not len(digit_pos):
+        raise ValueError("Move direction without a distance")
+    digit_line = np.cumsum(is_direction, dtype=np.int64)[digit_pos] - 1
+    counts = np.bincount(digit_line[digit_line >= 0], minlength=len(direction_pos))
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    if digit_line[0] < 0 or not counts.all() or counts.max() > 18 \
+            or (digit_pos[starts] != direction_pos + 1).any() \
+            or (digit_pos[ends - 1] - digit_pos[starts] != counts - 1).any():
+        raise ValueError("Invalid move line, expected a direction followed by digits")
+
+    exponents = (ends[digit_line] - 1) - np.arange(len(digit_pos))
+    weighted = (buf[digit_pos] - ord("0")).astype(np.int64) * powers_of_10()[exponents]
+    distances = np.add.reduceat(weighted, starts)
+    return np.where(buf[direction_pos] == ord("L"), -distances, distances)
+
+
+def part1(deltas: np.ndarray, start: int = START_POSITION) -> int:
+    """Part 1 from a prefix sum, positions are the running total mod 100."""
+    positions = (start + np.cumsum(deltas)) % DIAL_SIZE
+    return int(np.count_nonzero(positions == 0))
+
+
+def part2(deltas: np.ndarray, start: int = START_POSITION) -> int:
+    """Part 2 from floor-division differences of consecutive running totals.
+
+    Without the mod the dial position is just the running total S. Going
+    right from S0 to S1 passes a zero once per multiple of 100 in (S0, S1],
+    going left once per multiple in [S1, S0).
+    """
+    totals = start + np.concatenate(([0], np.cumsum(deltas)))
+    before, after = totals[:-1], totals[1:]
+    right = after // DIAL_SIZE - before // DIAL_SIZE
+    left = (before - 1) // DIAL_SIZE - (after - 1) // DIAL_SIZE
+    return int(np.where(deltas > 0, right, left).sum())
+
+
 def is_zero(rolling_sum: int):
     '''simple did we hit a 0?'''
     return True if rolling_sum % 100 == 0 else False
@@ -44,7 +138,8 @@ def calculate_number_zeros_hit(start: int, move: Move) -> int:
     number_moves = 0 if move.move < distance_to_first_0 else 1 + ((move.move - distance_to_first_0) // 100)
     return number_moves
 
-def part1(moves: List[Move]):
+def part1_scan(moves: List[Move]):
+    '''Part 1 by stepping Move by Move, kept as a reference'''
     rolling_sum, pwd = 50, 0
     for move in moves:
         direction_multiplier = 1 if move.direction == 'R' else -1
@@ -54,7 +149,8 @@ def part1(moves: List[Move]):
             pwd += 1
     return pwd
 
-def part2(moves: List[Move]): 
+def part2_scan(moves: List[Move]):
+    '''Part 2 by stepping Move by Move, kept as a reference'''
     start, pwd = 50, 0
     for move in moves:
         new_start = calculate_final_position(start, move)
@@ -63,12 +159,115 @@ def part2(moves: List[Move]):
         pwd += count_moves
     return pwd
 
+def iter_moves(path: str | Path) -> Iterator[Tuple[str, int]]:
+    """Yield (direction, distance) per line without keeping the file in memory."""
+    with Path(path).open("r", encoding="utf-8") as fh:
+        for raw in fh:
+            s = raw.strip()
+            if not s:
+                continue
+            try:
+                yield s[0], int(s[1:])
+            except ValueError as exc:
+                raise ValueError(f"Invalid move line: {s!r}") from exc
+
+
+def iter_move_chunks(fh: BinaryIO, chunk_size: int = 1 << 22) -> Iterator[np.ndarray]:
+    """Yield signed move arrays for roughly chunk_size bytes of the log at a time.
+
+    Chunks are cut after the last complete line (see aoc.parsing.line_chunks).
+    """
+    for chunk in line_chunks(fh, chunk_size):
+        yield parse_signed_moves(chunk)
+
+
+class DialState:
+    """Running dial position and both passwords, constant size however long the log is."""
+
+    def __init__(self, position: int = START_POSITION) -> None:
+        self.position = position
+        self.part1 = 0
+        self.part2 = 0
+        self.moves = 0
+
+    def step(self, direction: str, distance: int) -> None:
+        signed = distance if direction == 'R' else -distance
+        self.feed_total(self.position + signed, signed > 0)
+
+    def feed_total(self, total: int, right: bool) -> None:
+        if right:
+            self.part2 += total // DIAL_SIZE - self.position // DIAL_SIZE
+        else:
+            self.part2 += (self.position - 1) // DIAL_SIZE - (total - 1) // DIAL_SIZE
+        self.position = total % DIAL_SIZE
+        self.part1 += self.position == 0
+        self.moves += 1
+
+    def feed(self, deltas: np.ndarray) -> None:
+        """Fold a whole chunk of signed moves in with the array engine."""
+        if not len(deltas):
+            return
+        self.part1 += part1(deltas, self.position)
+        self.part2 += part2(deltas, self.position)
+        self.position = int((self.position + deltas.sum()) % DIAL_SIZE)
+        self.moves += len(deltas)
+
+    def __repr__(self) -> str:
+        return f'DialState(position={self.position}, part1={self.part1}, part2={self.part2}, moves={self.moves})'
+
+
+def solve_stream(path: str | Path, chunk_size: int = 1 << 22, chunked: bool = True) -> DialState:
+    """Both parts over the file in fixed-size chunks, memory is bounded by chunk_size.
+
+    chunked=False steps through the file one line at a time with plain ints
+    instead, no NumPy needed.
+    """
+    state = DialState()
+    if not chunked:
+        for direction, distance in iter_moves(path):
+            state.step(direction, distance)
+        return state
+    with Path(path).open("rb") as fh:
+        for deltas in iter_move_chunks(fh, chunk_size):
+            state.feed(deltas)
+    return state
+
+
+def follow_moves(path: str | Path, state: DialState | None = None, poll_interval: float = 0.5,
+                 idle_timeout: float | None = None, chunk_size: int = 1 << 22) -> Iterator[DialState]:
+    """Like tail -f: fold in lines as they are appended to the log.
+
+    Yields the updated state after every batch of new complete lines, a
+    trailing partial line waits until its newline arrives. Stops once nothing
+    new has shown up for idle_timeout seconds (never, if None).
+    """
+    state = state or DialState()
+    with Path(path).open("rb") as fh:
+        # offset and time of the last read that got data, checked at each end of file
+        last_read = [fh.tell(), time.monotonic()]
+
+        def wait() -> bool:
+            if fh.tell() != last_read[0]:
+                last_read[:] = [fh.tell(), time.monotonic()]
+            if idle_timeout is not None and time.monotonic() - last_read[1] >= idle_timeout:
+                return False
+            time.sleep(poll_interval)
+            return True
+
+        for chunk in line_chunks(fh, chunk_size, wait):
+            state.feed(parse_signed_moves(chunk))
+            yield state
+
 if __name__ == "__main__":
     import argparse
     from pathlib import Path
 
     parser = argparse.ArgumentParser(description="Load moves from a file")
     parser.add_argument("path", nargs="?", help="Path to moves file (default: trial.txt next to this script)")
+    parser.add_argument("--vectorised", action="store_true", help="Parse into a NumPy array and solve both parts with reductions")
+    parser.add_argument("--stream", action="store_true", help="Fold over the file in fixed-size chunks with constant memory")
+    parser.add_argument("--per-line", action="store_true", help="With --stream, step line by line instead of in NumPy chunks")
+    parser.add_argument("--follow", action="store_true", help="Keep reading moves appended to the file, like tail -f")
     args = parser.parse_args()
 
     if args.path:
@@ -79,8 +278,27 @@ if __name__ == "__main__":
     if not demo_path.exists():
         raise SystemExit(f"Input file not found: {demo_path}")
 
+    if args.follow:
+        for state in follow_moves(demo_path):
+            print(f'Moves: {state.moves} Answer: {state.part1} Answer: {state.part2}', flush=True)
+        raise SystemExit(0)
+
+    if args.stream:
+        state = solve_stream(demo_path, chunked=not args.per_line)
+        print(f"Streamed {state.moves} moves")
+        print(f'Answer: {state.part1}')
+        print(f'Answer: {state.part2}')
+        raise SystemExit(0)
+
+    if args.vectorised:
+        deltas = load_signed_moves(demo_path)
+        print(f"Loaded {len(deltas)} moves")
+        print(f'Answer: {part1(deltas)}')
+        print(f'Answer: {part2(deltas)}')
+        raise SystemExit(0)
+
     parsed = load_moves(demo_path)
     print(f"Loaded {len(parsed)} moves")
-    print(f'Answer: {part1(parsed)}')
-    print(f'Answer: {part2(parsed)}')
+    print(f'Answer: {part1_scan(parsed)}')
+    print(f'Answer: {part2_scan(parsed)}')
     
\ No newline at end of file
@@ -1,6 +1,11 @@
+import sys
 from pathlib import Path
 from util import Range, load_file
-from typing import List
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.intervals import IntervalSet
+from aoc.records import RangeColumns, range_bounds
+from typing import List, Tuple
 
 def detect_repeat(number: str) -> bool:
     if len(number) % 2 == 0:
@@ -9,7 +14,8 @@ def detect_repeat(number: str) -> bool:
     else:
         return False
 
-def part1(parsed_ranges: Range):
+def part1_scan(parsed_ranges: Range):
+    """Part 1 by testing every number in every range, kept as a reference."""
     final_ans = 0
     for ranges in parsed_ranges:
         start, end = ranges.start, ranges.end
@@ -39,7 +45,8 @@ def is_contained_in_ranges(ranges: List[Range], number: int) -> bool:
 
 def part2_reverse_max(parsed_ranges: List[Range]) -> int:
     seed = 1
-    limit = detect_max_in_limit(parsed_ranges)
+    index = IntervalSet(parsed_ranges)
+    limit = index.max_end()
     considered_set = set()
     while True:
         if int(str(seed) * 2) > limit:
@@ -52,7 +59,7 @@ def part2_reverse_max(parsed_ranges: List[Range]) -> int:
             if candidate_val > limit:
                 break
             
-            if is_contained_in_ranges(parsed_ranges, candidate_val):
+            if candidate_val in index:
                 considered_set.add(candidate_val)
             repeat += 1
             
@@ -61,7 +68,72 @@ def part2_reverse_max(parsed_ranges: List[Range]) -> int:
 
 
 
-def part2(parsed_ranges: List[Range]):
+def mobius(n: int) -> int:
+    '''Mobius function by trial division, n is at most the digit count'''
+    result, p = 1, 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def block_repeats(start: int, end: int, length: int, period: int) -> Tuple[int, int]:
+    """Count and sum the numbers in [start, end] that are a period-digit block
+    repeated to fill length digits.
+
+    Every such number is block * (10^(length-1) + ... + 1 spaced by period), so
+    the valid blocks form a contiguous run and the sum is an arithmetic series.
+    """
+    multiplier = (10 ** length - 1) // (10 ** period - 1)
+    low = max(10 ** (period - 1), -(-start // multiplier))
+    high = min(10 ** period - 1, end // multiplier)
+    if low > high:
+        return 0, 0
+    count = high - low + 1
+    return count, multiplier * (low + high) * count // 2
+
+
+def count_repeats(start: int, end: int, only_twice: bool = False) -> Tuple[int, int]:
+    """Count and sum repeated-pattern IDs in [start, end] without visiting them.
+
+    only_twice=True matches detect_repeat (block repeated exactly twice),
+    otherwise detect_repeat_updated (block repeated two or more times). For the
+    latter the numbers of a given length with some proper period are the union
+    over its divisors, which Mobius inclusion-exclusion turns into
+    -sum(mu(length/d) * repeats(d)) over the proper divisors d. Runtime only
+    depends on the number of digits.
+    """
+    count, total = 0, 0
+    for length in range(len(str(start)), len(str(end)) + 1):
+        if only_twice:
+            if length % 2 == 0:
+                c, t = block_repeats(start, end, length, length // 2)
+                count, total = count + c, total + t
+            continue
+        for period in range(1, length):
+            if length % period:
+                continue
+            sign = -mobius(length // period)
+            if sign:
+                c, t = block_repeats(start, end, length, period)
+                count, total = count + sign * c, total + sign * t
+    return count, total
+
+
+def part1(parsed_ranges: List[Range] | RangeColumns) -> int:
+    return sum(count_repeats(start, end, only_twice=True)[1] for start, end in range_bounds(parsed_ranges))
+
+
+def part2(parsed_ranges: List[Range] | RangeColumns) -> int:
+    return sum(count_repeats(start, end)[1] for start, end in range_bounds(parsed_ranges))
+
+
+def part2_scan(parsed_ranges: List[Range]):
+    """Part 2 by testing every number in every range, kept as a reference."""
     final_ans = 0
     for ranges in parsed_ranges:
         start, end = ranges.start, ranges.end
@@ -92,27 +164,14 @@ if __name__ == "__main__":
 
     # If timing requested, run each part multiple times and print stats
     if args.time and args.time > 0:
-        import time
-        import statistics
-
-        def time_runs(func, *fargs, repeats: int = 5):
-            times: list[float] = []
-            last = None
-            for _ in range(repeats):
-                t0 = time.perf_counter()
-                last = func(*fargs)
-                t1 = time.perf_counter()
-                times.append(t1 - t0)
-            return last, times
-
-        _, times1 = time_runs(part1, parsed, repeats=args.time)
-        _, times2 = time_runs(part2, parsed, repeats=args.time)
-        _, times3 = time_runs(part2_reverse_max, parsed, repeats=args.time)
-
-        print(f"part1: runs={args.time} min={min(times1):.6f}s mean={statistics.mean(times1):.6f}s std={statistics.pstdev(times1):.6f}s")
-        print(f"part2: runs={args.time} min={min(times2):.6f}s mean={statistics.mean(times2):.6f}s std={statistics.pstdev(times2):.6f}s")
-        print(f"part2 pro: runs={args.time} min={min(times3):.6f}s mean={statistics.mean(times3):.6f}s std={statistics.pstdev(times3):.6f}s")
+        from aoc.bench import measure
+
+        for name, func in [("part1 scan", part1_scan), ("part2 scan", part2_scan), ("part2 reverse max", part2_reverse_max),
+                           ("part1 closed form", part1), ("part2 closed form", part2)]:
+            print(measure(func, parsed, name=name, warmup=0, repeats=args.time))
     else:
-        print(f'Solution for part 1: {part1(parsed)}')
-        print(f'Solution for part 2: {part2(parsed)}')
-        print(f'Solution for part 2: {part2_reverse_max(parsed)}')
\ No newline at end of file
+        print(f'Solution for part 1: {part1_scan(parsed)}')
+        print(f'Solution for part 2: {part2_scan(parsed)}')
+        print(f'Solution for part 2: {part2_reverse_max(parsed)}')
+        print(f'Solution for part 1 (closed form): {part1(parsed)}')
+        print(f'Solution for part 2 (closed form): {part2(parsed)}')
\ No newline at end of file
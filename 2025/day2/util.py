@@ -1,9 +1,13 @@
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.records import RangeColumns
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Range:
     start: int
     end: int
@@ -28,3 +32,16 @@ def load_file(path: str | Path) -> List[Range]:
             raise ValueError(f"Invalid range segment: {seg!r}") from exc
 
     return ranges
+
+
+def load_range_columns(path: str | Path) -> RangeColumns:
+    """Same input as load_file, but into RangeColumns (two int64 arrays, no Range objects)."""
+    text = Path(path).read_text(encoding="utf-8").strip()
+    ranges = RangeColumns()
+    for seg in (s.strip() for s in text.split(",") if s.strip()):
+        try:
+            start_s, end_s = seg.split("-", 1)
+            ranges.append(int(start_s), int(end_s))
+        except ValueError as exc:
+            raise ValueError(f"Invalid range segment: {seg!r}") from exc
+    return ranges
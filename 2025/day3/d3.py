@@ -1,6 +1,10 @@
+import sys
 from pathlib import Path
 from typing import List
-import timeit
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grids import load_digit_grid
+from aoc.instrument import counted, phase
 
 def load_grid(path: str | Path, to_int: bool = True) -> List[List[int]]:
 	"""Load a file into a grid (list of lists).
@@ -32,9 +36,6 @@ def load_grid(path: str | Path, to_int: bool = True) -> List[List[int]]:
 
 	return grid
 
-def solve(grid):
-    return part2(grid)
-
 def find_max(row, limit):
 	max_val, max_index = float("-inf"), -1
 	for i in range(limit):
@@ -45,7 +46,47 @@ def find_max(row, limit):
 			max_val, max_index = row[i], i
 	return max_val, max_index
 
+@counted
+def select_digits(row, k: int) -> List[int]:
+	"""Lexicographically largest k-digit subsequence of row, in one pass.
+
+	Monotonic stack: a smaller digit is popped whenever a bigger one arrives
+	and there are still digits we are allowed to drop (len(row) - k in total).
+	"""
+	drop = len(row) - k
+	stack: List[int] = []
+	for digit in row:
+		while drop > 0 and stack and stack[-1] < digit:
+			stack.pop()
+			drop -= 1
+		stack.append(digit)
+	del stack[k:]
+	return stack
+
+def joltage(row, k: int, offset: int = 0) -> int:
+	"""offset is subtracted from every selected cell, ord('0') for raw byte rows.
+
+	Cells go through int() so NumPy uint8 rows accumulate in Python ints
+	instead of wrapping around at 255.
+	"""
+	value = 0
+	for digit in select_digits(row, k):
+		value = value * 10 + int(digit) - offset
+	return value
+
+def max_joltage(grid, k: int) -> int:
+	"""grid is a list of int rows or a ByteGrid from load_digit_grid"""
+	offset = getattr(grid, "offset", 0)
+	return sum(joltage(row, k, offset) for row in grid)
+
 def part1(grid: List[List[int]]) -> int:
+	return max_joltage(grid, 2)
+
+def part2(grid: List[List[int]]) -> int:
+	return max_joltage(grid, 12)
+
+def part1_scan(grid: List[List[int]]) -> int:
+	"""Part 1 with the original max-search per row, kept as a reference."""
 	solution = 0
 	for row in grid:
 		search_limit = len(row)
@@ -63,6 +104,7 @@ def part1(grid: List[List[int]]) -> int:
 		solution += current_sol
 	return solution
 
+@counted
 def find_max_range(row, start, end):
 	max_val, max_index = float("-inf"), -1
 	for i in range(start, end):
@@ -73,7 +115,8 @@ def find_max_range(row, start, end):
 			max_val, max_index = row[i], i
 	return max_val, max_index
 
-def part2(grid: List[List[int]]) -> int:
+def part2_scan(grid: List[List[int]]) -> int:
+	"""Part 2 with the original max-search per row, kept as a reference."""
 	solution = 0
 	for row in grid:
 		mo_digits = 11
@@ -96,6 +139,8 @@ if __name__ == "__main__":
 	parser.add_argument("path", nargs="?", help="Path to grid file (default: trial.txt next to this script)")
 	parser.add_argument("--no-int", dest="to_int", action="store_false", help="Leave characters as strings instead of converting to int")
 	parser.add_argument("-n", type=int, default=5, help="Number of rows to print as sample")
+	parser.add_argument("--bytes", action="store_true", help="Load the grid as one byte buffer instead of lists of ints")
+	parser.add_argument("--mmap", action="store_true", help="Like --bytes, but memory-map the file")
 	args = parser.parse_args()
 
 	if args.path:
@@ -106,18 +151,23 @@ if __name__ == "__main__":
 	if not path.exists():
 		raise SystemExit(f"Input file not found: {path}")
 
-	grid = load_grid(path, to_int=args.to_int)
-	print(f'Answer for part 1: {part1(grid)}')
-	print(f'Answer for part 2: {part2(grid)}')
-	
-	setup_code = "from __main__ import solve; from __main__ import grid"
-	stmt = "solve(grid)"
-	results = timeit.repeat(
-        stmt=stmt, 
-        setup=setup_code, 
-        repeat=5, 
-        number=5000 
-    )
-	min_time = min(results) / 5000 # Divide by number of runs to get time per call
-	print(f"\nTimeit Results (best of 5 runs, 5000 loops each):")
-	print(f"  Best time per call: {min_time * 1e6:.3f} microseconds") # Display in microseconds for small times
\ No newline at end of file
+	if args.bytes or args.mmap:
+		def load(path):
+			return load_digit_grid(path, use_mmap=args.mmap)
+	else:
+		def load(path):
+			return load_grid(path, to_int=args.to_int)
+
+	with phase("parse"):
+		grid = load(path)
+	with phase("part 1"):
+		print(f'Answer for part 1: {part1(grid)}')
+	with phase("part 2"):
+		print(f'Answer for part 2: {part2(grid)}')
+
+	from aoc.bench import measure
+
+	print()
+	print(measure(load, path, name="parse"))
+	print(measure(part1, grid, name="part 1"))
+	print(measure(part2, grid, name="part 2"))
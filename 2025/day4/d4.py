@@ -1,6 +1,16 @@
-import argparse
-import timeit
+from __future__ import annotations
+
+import sys
+from array import array
 from collections import deque
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grids import load_byte_grid
+from aoc.instrument import counted, phase
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 adjacent = [
     [-1, -1], [0, -1], [1, -1],
@@ -13,6 +23,33 @@ def load_file(filepath: str) -> list[list[str]]:
     with open(filepath, 'r') as f:
         return [list(line.strip()) for line in f]
 
+def load_array(filepath: str, use_mmap: bool = False) -> np.ndarray:
+    """Load file as a (rows, cols) uint8 array, 1 where there is a roll ('@').
+
+    The file is viewed in place through load_byte_grid, the roll mask is the
+    only array allocated.
+    """
+    raw = load_byte_grid(filepath, use_mmap=use_mmap).array()
+    return (raw == ord('@')).view(np.uint8)
+
+
+@counted
+def neighbour_counts(rolls: np.ndarray) -> np.ndarray:
+    """Number of rolls among the 8 neighbours of every cell, as a sum of shifted slices."""
+    rows, cols = rolls.shape
+    padded = np.pad(rolls, 1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for x, y in adjacent:
+        counts += padded[1 + x:1 + x + rows, 1 + y:1 + y + cols]
+    return counts
+
+
+def part1(rolls: np.ndarray) -> int:
+    """Part 1 as a single mask reduction over the whole grid."""
+    return int(np.count_nonzero(rolls.astype(bool) & (neighbour_counts(rolls) < 4)))
+
+
+@counted
 def check_adjacent_positions(i: int, j: int, grid: list[list[str]]) -> bool:
     num_adj = 0
     for x, y in adjacent:
@@ -28,8 +65,8 @@ def check_adjacent_positions(i: int, j: int, grid: list[list[str]]) -> bool:
     return True if num_adj < 4 and grid[i][j] == '@' else False
 
 
-def part1(grid: list[list[str]]) -> int:
-    """Solve part 1 of the puzzle."""
+def part1_scan(grid: list[list[str]]) -> int:
+    """Part 1 cell by cell on the character grid, kept as a reference."""
     eligible_rolls = 0
     for i in range(len(grid)):
         for j in range(len(grid[i])):
@@ -37,8 +74,8 @@ def part1(grid: list[list[str]]) -> int:
                 eligible_rolls += 1
     return eligible_rolls
 
-def part2(grid: list[list[str]]) -> int:
-    """Solve part 2 using a queue and your original helper."""
+def part2_scan(grid: list[list[str]]) -> int:
+    """Part 2 with a queue over the character grid, kept as a reference (mutates grid)."""
     rows = len(grid)
     cols = len(grid[0])
     
@@ -81,39 +118,79 @@ def part2(grid: list[list[str]]) -> int:
     return removed_count
 
 
+def part2(rolls: np.ndarray, threshold: int = 4) -> int:
+    """Solve part 2 by peeling with incrementally maintained neighbour counts.
+
+    The grid is flattened with a one-cell border so neighbours are fixed index
+    offsets. Removing a roll decrements its neighbours' counts and a roll is
+    queued exactly once, when its count first drops below threshold, so every
+    queued roll gets removed and the total work is O(cells).
+
+    alive and counts are bytearrays (1 byte per cell, indexed as fast as a
+    list) and the queue is an array('q'), where Python lists would cost
+    about 40 bytes per cell.
+    """
+    rows, cols = rolls.shape
+    width = cols + 2
+    padded = np.pad(rolls, 1).ravel()
+    padded_counts = np.pad(neighbour_counts(rolls), 1).ravel()
+    queue = array('q', np.flatnonzero(padded.astype(bool) & (padded_counts < threshold)).astype(np.int64).tobytes())
+    alive = bytearray(padded.astype(np.uint8))
+    counts = bytearray(padded_counts)
+    del padded, padded_counts
+    offsets = [x * width + y for x, y in adjacent]
+
+    head = 0
+    while head < len(queue):
+        cell = queue[head]
+        head += 1
+        alive[cell] = 0
+        for offset in offsets:
+            neighbour = cell + offset
+            if alive[neighbour]:
+                counts[neighbour] -= 1
+                if counts[neighbour] == threshold - 1:
+                    queue.append(neighbour)
+
+    return len(queue)
+
+
 def solve_part1(filepath: str) -> int:
     """Wrapper to solve part 1."""
-    grid = load_file(filepath)
-    return part1(grid)
+    return part1(load_array(filepath))
 
 
 def solve_part2(filepath: str) -> int:
     """Wrapper to solve part 2."""
-    grid = load_file(filepath)
-    return part2(grid)
+    return part2(load_array(filepath))
 
 
 if __name__ == "__main__":
+    import argparse
+
+    from aoc.bench import measure
+
     parser = argparse.ArgumentParser(description="Advent of Code 2025 Day 4")
     parser.add_argument("filepath", help="Path to input file")
     args = parser.parse_args()
 
     # Load the grid
-    grid = load_file(args.filepath)
+    with phase("parse"):
+        rolls = load_array(args.filepath)
 
-    print(f"Loaded grid: {len(grid)} rows x {len(grid[0])} cols")
+    print(f"Loaded grid: {rolls.shape[0]} rows x {rolls.shape[1]} cols")
+    print(measure(load_array, args.filepath, name="parse"))
 
     # Part 1
     print("\n=== Part 1 ===")
-    result1 = part1(grid)
+    with phase("part 1"):
+        result1 = part1(rolls)
     print(f"Answer for part 1: {result1}")
-    time1 = timeit.timeit(lambda: solve_part1(args.filepath), number=100)
-    print(f"Average CPU time (100 runs): {time1/100:.6f} seconds")
+    print(measure(part1, rolls, name="solve"))
 
-    # Part 2 (reload grid since part2 modifies it)
+    # Part 2
     print("\n=== Part 2 ===")
-    grid = load_file(args.filepath)
-    result2 = part2(grid)
+    with phase("part 2"):
+        result2 = part2(rolls)
     print(f"Answer for part 2: {result2}")
-    time2 = timeit.timeit(lambda: solve_part2(args.filepath), number=100)
-    print(f"Average CPU time (100 runs): {time2/100:.6f} seconds")
\ No newline at end of file
+    print(measure(part2, rolls, name="solve"))
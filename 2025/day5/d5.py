@@ -1,9 +1,13 @@
-import argparse
-import timeit
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.intervals import IntervalSet
+from aoc.records import RangeColumns
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Range:
     start: int
     end: int
@@ -33,12 +37,33 @@ def load_file(filepath: str) -> tuple[list[Range], list[int]]:
 
     return ranges, values
 
+def load_columns(filepath: str) -> tuple[RangeColumns, list[int]]:
+    """Like load_file, but the ranges go into RangeColumns instead of Range objects."""
+    ranges = RangeColumns()
+    values = []
+    with open(filepath, 'r') as f:
+        lines = iter(f)
+        for line in lines:
+            line = line.strip()
+            if line == '':
+                break
+            start, end = line.split('-')
+            ranges.append(int(start), int(end))
+        values.extend(int(line) for line in lines if line.strip())
+    return ranges, values
+
+
 def check_if_in_range(range: Range, value: int) -> bool:
     return True if value >= range.start and value <= range.end else False
         
 
-def part1(ranges: list[Range], values: list[int]) -> int:
+def part1(ranges: list[Range] | RangeColumns, values: list[int]) -> int:
     """Solve part 1 of the puzzle."""
+    return IntervalSet(ranges).count_contained(values)
+
+
+def part1_scan(ranges: list[Range], values: list[int]) -> int:
+    """Part 1 by scanning every range for every value, kept as a reference."""
     fresh_ingredients = 0
     for value in values:
         for range in ranges:
@@ -64,42 +89,28 @@ def find_power_of_2(max: int) -> int:
             return 2 ** pow
         pow += 1
 
-def is_overlapping(range_left: Range, range_right: Range) -> bool:
-    return range_right.start <= range_left.end + 1
-
-def merge_overlap(range_left: Range, range_right: Range) -> Range:
-    start = min(range_left.start, range_right.start)
-    end = max(range_left.end, range_right.end)
-    return Range(start, end)
-
-def part2(ranges: list[Range]) -> int:
+def part2(ranges: list[Range] | RangeColumns) -> int:
     """Solve part 2 of the puzzle."""
-    sorted_ranges = sorted(ranges, key=lambda r: r.start)
-    merged_ranges = [sorted_ranges[0]]
-
-    for i in range(1, len(sorted_ranges)):
-        current_range = sorted_ranges[i]
-        if is_overlapping(merged_ranges[-1], current_range):
-            merged_ranges[-1] = merge_overlap(merged_ranges[-1], current_range)
-        else:
-            merged_ranges.append(current_range)
-
-    return sum([(current_range.end - current_range.start + 1)for current_range in merged_ranges])
+    return IntervalSet(ranges).total_length()
 
 
 def solve_part1(filepath: str) -> int:
     """Wrapper to solve part 1."""
-    ranges, values = load_file(filepath)
+    ranges, values = load_columns(filepath)
     return part1(ranges, values)
 
 
 def solve_part2(filepath: str) -> int:
     """Wrapper to solve part 2."""
-    ranges, values = load_file(filepath)
+    ranges, values = load_columns(filepath)
     return part2(ranges)
 
 
 if __name__ == "__main__":
+    import argparse
+
+    from aoc.bench import measure
+
     parser = argparse.ArgumentParser(description="Advent of Code 2025 Day 5")
     parser.add_argument("filepath", help="Path to input file")
     args = parser.parse_args()
@@ -114,8 +125,9 @@ if __name__ == "__main__":
     try:
         result1 = part1(ranges, values)
         print(f"Answer for part 1: {result1}")
-        time1 = timeit.timeit(lambda: solve_part1(args.filepath), number=100)
-        print(f"Average CPU time (100 runs): {time1/100:.6f} seconds")
+        print(measure(load_columns, args.filepath, name="parse"))
+        columns, _ = load_columns(args.filepath)
+        print(measure(part1, columns, values, name="solve"))
     except NotImplementedError as e:
         print(f"Part 1: {e}")
 
@@ -124,7 +136,6 @@ if __name__ == "__main__":
     try:
         result2 = part2(ranges)
         print(f"Answer for part 2: {result2}")
-        time2 = timeit.timeit(lambda: solve_part2(args.filepath), number=100)
-        print(f"Average CPU time (100 runs): {time2/100:.6f} seconds")
+        print(measure(part2, columns, name="solve"))
     except NotImplementedError as e:
         print(f"Part 2: {e}")
\ No newline at end of file
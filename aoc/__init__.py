@@ -0,0 +1,7 @@
+"""Helpers shared across the Advent of Code days.
+
+The day scripts are still run directly (python 2025/day5/d5.py ...), so they
+put the repository root on sys.path before importing from here.
+
+`python -m aoc` runs any set of days from one interpreter, see aoc.registry.
+"""
@@ -0,0 +1,3 @@
+from aoc.registry import main
+
+raise SystemExit(main())
@@ -0,0 +1,189 @@
+"""Benchmark harness shared by every day.
+
+Times parsing and solving separately with warmup, an adaptive repeat count
+and min/median/p95 stats, and writes the results to JSON so two runs can be
+diffed. Usable as a library (measure) or from the command line:
+
+    python -m aoc.bench                      # every registered day
+    python -m aoc.bench 2025/day4 -o run.json
+    python -m aoc.bench --compare base.json  # flag regressions against a saved run
+"""
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+# NamedTuple rather than a dataclass: dataclasses pulls in inspect, ~20ms of
+# startup for every process that only wants load_day_module
+class Stats(NamedTuple):
+    name: str
+    repeats: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+
+    def to_dict(self) -> dict:
+        return self._asdict()
+
+    def __str__(self) -> str:
+        return (f"{self.name}: runs={self.repeats} min={self.min:.6f}s "
+                f"median={self.median:.6f}s p95={self.p95:.6f}s mean={self.mean:.6f}s")
+
+
+def summarise(name: str, times: List[float]) -> Stats:
+    import statistics
+
+    ordered = sorted(times)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return Stats(name, len(times), ordered[0], statistics.median(ordered), p95, statistics.fmean(ordered))
+
+
+def measure(func: Callable, *args, name: Optional[str] = None, setup: Optional[Callable] = None,
+            warmup: int = 1, repeats: Optional[int] = None, min_time: float = 0.2,
+            max_repeats: int = 1000) -> Stats:
+    """Time func(*args) with time.perf_counter.
+
+    setup, if given, is called before every run (outside the timed region)
+    and its return value is used as the argument tuple, for solvers that
+    mutate their input. warmup untimed runs come first. Without an explicit
+    repeats count, enough runs are made to fill roughly min_time seconds (at
+    least 3, at most max_repeats), sized from the first warmup run or, with
+    warmup=0, from the first timed run.
+    """
+    name = name or getattr(func, "__name__", repr(func))
+
+    def run_once() -> float:
+        call_args = setup() if setup is not None else args
+        t0 = time.perf_counter()
+        func(*call_args)
+        return time.perf_counter() - t0
+
+    warmup_times = [run_once() for _ in range(warmup)]
+    times = []
+    if repeats is None:
+        if not warmup_times:
+            times.append(run_once())
+        first = (warmup_times or times)[0]
+        repeats = max(3, min(max_repeats, int(min_time / max(first, 1e-9))))
+    times += [run_once() for _ in range(repeats - len(times))]
+    return summarise(name, times)
+
+
+def load_day_module(path: Path):
+    """Import a day script by path, with its directory on sys.path for sibling imports."""
+    day_dir = str(path.parent)
+    if day_dir not in sys.path:
+        sys.path.insert(0, day_dir)
+    module_name = "aoc_" + "_".join(path.relative_to(ROOT).with_suffix("").parts)
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover(selection: Optional[List[str]] = None) -> List[str]:
+    """Registered days (see aoc.registry), optionally only those in selection."""
+    from aoc.registry import REGISTRY
+
+    return [day for day in REGISTRY if not selection or day in selection]
+
+
+def bench_day(day: str, input_path: Optional[Path] = None, **options) -> List[dict]:
+    """Time the day's registered Solver, the load and parts `python -m aoc` ships.
+
+    Both parts are timed on one parse, Solvers leave their input untouched.
+    """
+    from aoc.registry import REGISTRY, solver
+
+    input_path = Path(input_path or REGISTRY[day].default_input)
+    if not input_path.exists():
+        return []
+    entry = solver(day)
+
+    results = []
+    parse = measure(entry.load, input_path, name=f"{day} load", **options)
+    results.append({"day": day, "phase": "parse", "function": entry.load.__qualname__, **parse.to_dict()})
+    parsed = entry.load(input_path)
+    for part in ("part1", "part2"):
+        func = getattr(entry, part)
+        stats = measure(func, parsed, name=f"{day} {part}", **options)
+        results.append({"day": day, "phase": part, "function": func.__qualname__, **stats.to_dict()})
+    return results
+
+
+def compare(current: List[dict], baseline: List[dict], threshold: float) -> List[str]:
+    """Entries whose median got slower than baseline by more than threshold (0.1 = 10%),
+    and baseline entries the current run did not measure at all."""
+    before = {(r["day"], r["phase"]): r for r in baseline}
+    measured = {(r["day"], r["phase"]) for r in current}
+    regressions = []
+    for result in current:
+        old = before.get((result["day"], result["phase"]))
+        if old and result["median"] > old["median"] * (1 + threshold):
+            regressions.append(f"{result['name']}: median {old['median']:.6f}s -> {result['median']:.6f}s")
+    for day, phase in before:
+        if (day, phase) not in measured:
+            regressions.append(f"{day} {phase}: in the baseline but not measured")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import json
+    import platform
+
+    parser = argparse.ArgumentParser(description="Benchmark parse and solve time of every day")
+    parser.add_argument("days", nargs="*", help="Days to run, e.g. 2025/day4 (default: all)")
+    parser.add_argument("--input", type=Path, help="Input file (only with a single day)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds of runs to aim for per measurement")
+    parser.add_argument("--repeats", type=int, help="Fixed repeat count instead of the adaptive one")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before measuring")
+    parser.add_argument("-o", "--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed median slowdown vs baseline")
+    args = parser.parse_args(argv)
+
+    if args.input and len(args.days) != 1:
+        parser.error("--input needs exactly one day")
+    days = discover(args.days)
+    unknown = [day for day in args.days if day not in days]
+    if unknown:
+        parser.error(f"unknown day(s): {', '.join(unknown)}")
+
+    results = []
+    for day in days:
+        for result in bench_day(day, args.input, warmup=args.warmup,
+                                repeats=args.repeats, min_time=args.min_time):
+            print(f"{result['name']}: runs={result['repeats']} min={result['min']:.6f}s "
+                  f"median={result['median']:.6f}s p95={result['p95']:.6f}s")
+            results.append(result)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.compare:
+        # only the days of this run, `aoc.bench 2025/day4 --compare all.json` checks day 4
+        baseline = [r for r in json.loads(args.compare.read_text(encoding="utf-8"))["results"] if r["day"] in days]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+"""Fixed-layout binary inputs, memory-mapped back as NumPy views.
+
+A day's input is parsed once with its text loader, packed into named arrays
+by its registry Solver (the same pack the cache uses) and written as:
+
+    header   "AOCB", u16 version, u16 section count
+    sections name (16 bytes), dtype str (8 bytes, e.g. '<i8'), u64 rows,
+             u64 cols (0 for a 1-D array), u64 byte offset of the data
+    data     each array's raw bytes, C order, 64-byte aligned
+
+Loading maps the file read-only and every array is an np.frombuffer view
+into the mapping, so opening a multi-GB input costs a header parse and
+worker processes mapping the same file share its pages.
+
+    python -m aoc.binary 2025/day4 -o day4.aocb        # compile the day's input
+    python -m aoc 2025/day4 --input day4.aocb          # solve from it
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+MAGIC = b"AOCB"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+SECTION = struct.Struct("<16s8sQQQ")
+ALIGN = 64
+
+
+def is_binary(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_sections(path: Path, arrays: Dict[str, np.ndarray]) -> Path:
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    table_end = HEADER.size + SECTION.size * len(arrays)
+    offset = -(-table_end // ALIGN) * ALIGN
+    table, layout = [], []
+    for name, array in arrays.items():
+        if array.ndim not in (1, 2) or len(name.encode()) > 16 or len(array.dtype.str) > 8:
+            raise ValueError(f"Cannot store section {name!r} ({array.dtype}, {array.ndim}-D)")
+        rows, cols = (array.shape[0], 0) if array.ndim == 1 else array.shape
+        table.append(SECTION.pack(name.encode(), array.dtype.str.encode(), rows, cols, offset))
+        layout.append((offset, array))
+        offset = -(-(offset + array.nbytes) // ALIGN) * ALIGN
+
+    path = Path(path)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(arrays)))
+        f.writelines(table)
+        for section_offset, array in layout:
+            f.seek(section_offset)
+            f.write(array.tobytes())
+        f.truncate(offset)  # pad to the aligned end, also covers a trailing empty section
+    return path
+
+
+def load_sections(path: Path) -> Dict[str, np.ndarray]:
+    """Map path and return its arrays as read-only views, nothing is copied."""
+    with open(path, "rb") as f:
+        if Path(path).stat().st_size == 0:
+            raise ValueError(f"{path} is empty")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, count = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an AOCB file")
+    if version != VERSION:
+        raise ValueError(f"{path} has format version {version}, expected {VERSION}")
+
+    arrays = {}
+    for i in range(count):
+        name, dtype, rows, cols, offset = SECTION.unpack_from(mapped, HEADER.size + i * SECTION.size)
+        dtype = np.dtype(dtype.rstrip(b"\0").decode())
+        shape = (rows,) if cols == 0 else (rows, cols)
+        count_items = rows * max(cols, 1)
+        if offset + count_items * dtype.itemsize > len(mapped):
+            raise ValueError(f"{path} is truncated")
+        view = np.frombuffer(mapped, dtype=dtype, count=count_items, offset=offset)
+        arrays[name.rstrip(b"\0").decode()] = view.reshape(shape)
+    return arrays
+
+
+def convert(day: str, input_path: Optional[Path], output: Path) -> Path:
+    """Parse a day's text input with its loader and write the packed arrays."""
+    from aoc.registry import REGISTRY, solver
+
+    entry = solver(day)
+    if entry.pack is None:
+        raise ValueError(f"{day} has no array layout to compile to")
+    parsed = entry.load(Path(input_path or REGISTRY[day].default_input))
+    return write_sections(output, entry.pack(parsed))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    from aoc.registry import REGISTRY, solver
+
+    packable = [day for day in REGISTRY if solver(day).pack is not None]
+    parser = argparse.ArgumentParser(description="Compile a day's text input into an mmap-able binary file")
+    parser.add_argument("day", choices=packable)
+    parser.add_argument("--input", type=Path, help="Text input (default: the day's own input)")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Binary file to write")
+    args = parser.parse_args(argv)
+
+    path = convert(args.day, args.input, args.output)
+    for name, array in load_sections(path).items():
+        print(f"{name}: {array.dtype} {array.shape}")
+    print(f"wrote {path} ({path.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+"""Content-addressed on-disk cache of parsed inputs and answers.
+
+Entries are keyed by the SHA-256 of the input file, the day and a hash of
+the solver source (the day directory plus this package), so editing either
+the input or the code misses the cache instead of serving a stale answer.
+
+Each entry is one `<key>.<part>.json` per answer found so far (one file per
+part, so parallel workers solving different parts never overwrite each
+other's answer) and, for days whose Solver can pack its parsed input into
+arrays, a `<key>.npz` with them (plain arrays, nothing is pickled). Reading an entry bumps its mtime and the
+least recently used entries are evicted once the directory grows past
+max_bytes.
+"""
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from aoc.bench import ROOT
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+DEFAULT_DIR = ROOT / ".aoc-cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SOURCE_HASHES: Dict[str, str] = {}
+
+
+def file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def solver_version(day: str) -> str:
+    """Hash of every .py file the day's solver can depend on."""
+    if day not in _SOURCE_HASHES:
+        digest = hashlib.sha256()
+        for path in sorted((ROOT / day).glob("*.py")) + sorted((ROOT / "aoc").glob("*.py")):
+            digest.update(path.relative_to(ROOT).as_posix().encode())
+            digest.update(path.read_bytes())
+        _SOURCE_HASHES[day] = digest.hexdigest()[:16]
+    return _SOURCE_HASHES[day]
+
+
+def _plain(answer):
+    """NumPy scalars to Python ints so answers round-trip through JSON."""
+    return answer.item() if hasattr(answer, "item") else answer
+
+
+class ResultCache:
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory or os.environ.get("AOC_CACHE_DIR") or DEFAULT_DIR)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, day: str, input_path: Path) -> str:
+        name = f"{day}\0{solver_version(day)}\0{file_digest(input_path)}"
+        return hashlib.sha256(name.encode()).hexdigest()[:32]
+
+    def _answer_path(self, key: str, part: str) -> Path:
+        return self.directory / f"{key}.{part}.json"
+
+    def _data_path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def answers(self, key: str) -> Dict[str, object]:
+        answers = {}
+        for path in self.directory.glob(f"{key}.*.json"):
+            try:
+                answers[path.name[len(key) + 1:-len(".json")]] = json.loads(path.read_text(encoding="utf-8"))["answer"]
+            except (FileNotFoundError, ValueError, KeyError):
+                continue
+            path.touch()
+        return answers
+
+    def store_answers(self, key: str, day: str, answers: Dict[str, object]) -> None:
+        for part, answer in answers.items():
+            self._write(self._answer_path(key, part), json.dumps({"day": day, "answer": _plain(answer)}).encode())
+        self.evict()
+
+    def arrays(self, key: str) -> Optional[dict]:
+        """The packed parse for key, or None. Arrays are read eagerly, the file is closed on return."""
+        data_path = self._data_path(key)
+        try:
+            with np.load(data_path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        data_path.touch()
+        return arrays
+
+    def store_arrays(self, key: str, arrays: dict) -> None:
+        data_path = self._data_path(key)
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        self._write(data_path, buffer.getvalue())
+        self.evict()
+
+    def _write(self, path: Path, data: bytes) -> None:
+        # write-then-rename so a concurrent reader (e.g. another pool worker)
+        # never sees half an entry, the pid keeps two writers apart
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def size(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.iterdir() if path.is_file())
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits in max_bytes, returns how many went."""
+        entries: Dict[str, list] = {}
+        for path in self.directory.iterdir():
+            if path.suffix in (".json", ".npz"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:  # evicted by another process meanwhile
+                    continue
+                # <key>.npz and every <key>.<part>.json go together
+                entry = entries.setdefault(path.name.split(".", 1)[0], [0.0, 0, []])
+                entry[0] = max(entry[0], stat.st_mtime)
+                entry[1] += stat.st_size
+                entry[2].append(path)
+        total = sum(size for _, size, _ in entries.values())
+        evicted = 0
+        for _, size, paths in sorted(entries.values(), key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        for path in self.directory.iterdir():
+            if path.suffix in (".json", ".npz", ".tmp"):
+                path.unlink(missing_ok=True)
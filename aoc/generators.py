@@ -0,0 +1,345 @@
+"""Deterministic synthetic inputs for scale testing.
+
+Every generator takes a seed plus size knobs and returns the input text in
+the same format as the real puzzle input, so the output can be handed to any
+day's loader, script or cross-check. From the command line:
+
+    python -m aoc.generators roll-grid --rows 2000 --cols 2000 -o big.txt
+    python -m aoc.generators scale 2025/day4 --sizes 100 200 400 -o scale.json
+    python -m aoc.generators compare 2023/day5 --sizes 1000 100000
+"""
+import random
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def almanac(seed: int = 0, seed_ranges: int = 10, maps: int = 7, nodes: int = 40,
+            width: int = 10 ** 8, limit: int = 2 ** 32) -> str:
+    """2023 day5: seed ranges plus a chain of maps with non-overlapping source ranges."""
+    rng = random.Random(seed)
+    seeds = []
+    for _ in range(seed_ranges):
+        seeds += [rng.randrange(limit - width), rng.randint(1, width)]
+    lines = ["seeds: " + " ".join(map(str, seeds))]
+    for m in range(maps):
+        lines += ["", f"map-{m}-to-{m + 1} map:"]
+        cuts = sorted(rng.sample(range(limit), 2 * nodes))
+        for source_start, source_end in zip(cuts[::2], cuts[1::2]):
+            length = source_end - source_start
+            lines.append(f"{rng.randrange(limit - length)} {source_start} {length}")
+    return "\n".join(lines) + "\n"
+
+
+def calibration(seed: int = 0, lines: int = 1000, length: int = 30) -> str:
+    """2023 day1: letters with digits and digit words mixed in, at least one digit per line."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(lines):
+        parts = []
+        while sum(map(len, parts)) < length:
+            roll = rng.random()
+            if roll < 0.15:
+                parts.append(str(rng.randint(1, 9)))
+            elif roll < 0.35:
+                parts.append(rng.choice(WORDS))
+            else:
+                parts.append(rng.choice("abcdefghijklmnopqrstuvwxyz"))
+        parts.insert(rng.randrange(len(parts) + 1), str(rng.randint(1, 9)))
+        out.append("".join(parts))
+    return "\n".join(out) + "\n"
+
+
+def game_records(seed: int = 0, games: int = 100, turns: int = 6, max_cubes: int = 20) -> str:
+    """2023 day2: 'Game N: 3 red, 1 blue; ...' lines."""
+    rng = random.Random(seed)
+    colors = ["red", "green", "blue"]
+    out = []
+    for game in range(1, games + 1):
+        turn_text = []
+        for _ in range(rng.randint(1, turns)):
+            shown = rng.sample(colors, rng.randint(1, 3))
+            turn_text.append(", ".join(f"{rng.randint(1, max_cubes)} {color}" for color in shown))
+        out.append(f"Game {game}: " + "; ".join(turn_text))
+    return "\n".join(out) + "\n"
+
+
+def scratchcards(seed: int = 0, cards: int = 200, winning: int = 10, mine: int = 25,
+                 max_number: int = 99) -> str:
+    """2023 day4: 'Card N: winning | mine' with distinct numbers on each side."""
+    rng = random.Random(seed)
+    pad = len(str(cards))
+    out = []
+    for card in range(1, cards + 1):
+        left = rng.sample(range(1, max_number + 1), winning)
+        right = rng.sample(range(1, max_number + 1), mine)
+        out.append(f"Card {card:>{pad}}: " + " ".join(f"{x:>2}" for x in left)
+                   + " | " + " ".join(f"{x:>2}" for x in right))
+    return "\n".join(out) + "\n"
+
+
+def dial_moves(seed: int = 0, count: int = 5000, max_distance: int = 999) -> str:
+    """2025 day1: one 'L68'/'R30' move per line."""
+    rng = random.Random(seed)
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, max_distance)}" for _ in range(count)) + "\n"
+
+
+def repeated_id(rng: random.Random, max_digits: int) -> int:
+    """A number made of one digit block repeated two or more times, e.g. 121212."""
+    length = rng.randint(2, max_digits)
+    period = rng.choice([p for p in range(1, length) if length % p == 0])
+    block = str(rng.randrange(10 ** (period - 1), 10 ** period))
+    return int(block * (length // period))
+
+
+def id_ranges(seed: int = 0, count: int = 30, max_digits: int = 10, width: int = 10 ** 5,
+              repeated: float = 0.5) -> str:
+    """2025 day2: disjoint comma-separated 'start-end' ranges on one line.
+
+    A `repeated` share of the ranges is placed around a repeated-pattern id
+    (with two or more repeats), so both parts have ids to find at any width.
+    """
+    rng = random.Random(seed)
+    limit = 10 ** max_digits
+    bounds = []
+    for start in rng.sample(range(1, limit - width), count):
+        if rng.random() < repeated:
+            number = repeated_id(rng, max_digits)
+            start = max(1, number - rng.randint(0, width))
+            bounds.append((start, max(number, start) + rng.randint(0, width)))
+        else:
+            bounds.append((start, start + rng.randint(0, width)))
+    ranges = []
+    previous_end = 0
+    for start, end in sorted(bounds):
+        start = max(start, previous_end + 1)
+        end = max(end, start)
+        ranges.append(f"{start}-{end}")
+        previous_end = end
+    rng.shuffle(ranges)
+    return ",".join(ranges) + "\n"
+
+
+def digit_grid(seed: int = 0, rows: int = 200, cols: int = 100) -> str:
+    """2025 day3: rows of digits 1-9."""
+    rng = random.Random(seed)
+    return "\n".join("".join(rng.choices("123456789", k=cols)) for _ in range(rows)) + "\n"
+
+
+def roll_grid(seed: int = 0, rows: int = 140, cols: int = 140, density: float = 0.6) -> str:
+    """2025 day4: '@' paper rolls and '.' floor."""
+    rng = random.Random(seed)
+    return "\n".join("".join("@" if rng.random() < density else "." for _ in range(cols))
+                     for _ in range(rows)) + "\n"
+
+
+def ingredient_ranges(seed: int = 0, count: int = 200, queries: int = 1000, width: int = 10 ** 12,
+                      limit: int = 10 ** 15) -> str:
+    """2025 day5: possibly overlapping 'start-end' ranges, a blank line, then one id per line."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        start = rng.randrange(limit - width)
+        lines.append(f"{start}-{start + rng.randint(0, width)}")
+    lines.append("")
+    lines += [str(rng.randrange(limit)) for _ in range(queries)]
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS: Dict[str, Callable[..., str]] = {
+    "almanac": almanac,
+    "calibration": calibration,
+    "game-records": game_records,
+    "scratchcards": scratchcards,
+    "dial-moves": dial_moves,
+    "id-ranges": id_ranges,
+    "digit-grid": digit_grid,
+    "roll-grid": roll_grid,
+    "ingredient-ranges": ingredient_ranges,
+}
+
+# day -> (generator, knob scaled by `scale` and `compare`), for the days the benchmark can run
+DAY_FORMATS = {
+    "2023/day1": ("calibration", "lines"),
+    "2023/day2": ("game-records", "games"),
+    "2023/day4": ("scratchcards", "cards"),
+    "2023/day5": ("almanac", "width"),  # seeds per range, what brute_force_min grows with
+    "2025/day1": ("dial-moves", "count"),
+    "2025/day2": ("id-ranges", "width"),
+    "2025/day3": ("digit-grid", "rows"),
+    "2025/day4": ("roll-grid", "rows"),
+    "2025/day5": ("ingredient-ranges", "queries"),
+}
+
+
+def write_input(kind: str, path: str | Path, seed: int = 0, **knobs) -> Path:
+    path = Path(path)
+    path.write_text(GENERATORS[kind](seed=seed, **knobs), encoding="utf-8")
+    return path
+
+
+def scale(day: str, sizes: List[int], seed: int = 0, workdir: Optional[Path] = None, **options) -> List[dict]:
+    """Benchmark one day on generated inputs of growing size.
+
+    Each result is a bench_day record plus the knob and size it was run at.
+    """
+    import tempfile
+
+    from aoc.bench import bench_day, discover
+
+    kind, knob = DAY_FORMATS[day]
+    if day not in discover([day]):
+        raise ValueError(f"{day} has no registered Solver to benchmark")
+    results = []
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for size in sizes:
+            input_path = write_input(kind, Path(tmp) / f"{kind}-{size}.txt", seed=seed, **{knob: size})
+            for result in bench_day(day, input_path, **options):
+                results.append({**result, "generator": kind, "knob": knob, "size": size})
+    return results
+
+
+def _day_module(day: str, name: str):
+    from aoc.bench import ROOT, load_day_module
+
+    return load_day_module(ROOT / day / name)
+
+
+def _calibration_reference():
+    d1 = _day_module("2023/day1", "d1.py")
+    return {"part2": lambda path: d1.calibration_sum_replace(path.read_text().splitlines())}
+
+
+def _almanac_reference():
+    d5 = _day_module("2023/day5", "d5.py")
+
+    def part1(path):
+        _, seeds, mapping_list = d5.read_file(path)
+        return min(d5.play_game(seed, mapping_list) for seed in seeds)
+
+    def part2(path):
+        intervals, _, mapping_list = d5.read_file(path)
+        return d5.brute_force_min(intervals, mapping_list)
+
+    return {"part1": part1, "part2": part2}
+
+
+def _dial_reference():
+    d1 = _day_module("2025/day1", "d1.py")
+    return {"part1": lambda path: d1.part1_scan(d1.load_moves(path)),
+            "part2": lambda path: d1.part2_scan(d1.load_moves(path))}
+
+
+def _id_ranges_reference():
+    d2 = _day_module("2025/day2", "d2.py")
+    return {"part1": lambda path: d2.part1_scan(d2.load_file(path)),
+            "part2": lambda path: d2.part2_scan(d2.load_file(path))}
+
+
+def _digit_grid_reference():
+    d3 = _day_module("2025/day3", "d3.py")
+    return {"part1": lambda path: d3.part1_scan(d3.load_grid(path)),
+            "part2": lambda path: d3.part2_scan(d3.load_grid(path))}
+
+
+def _roll_grid_reference():
+    d4 = _day_module("2025/day4", "d4.py")
+    return {"part1": lambda path: d4.part1_scan(d4.load_file(path)),
+            "part2": lambda path: d4.part2_scan(d4.load_file(path))}
+
+
+def _ingredient_reference():
+    d5 = _day_module("2025/day5", "d5.py")
+    return {"part1": lambda path: d5.part1_scan(*d5.load_file(path))}
+
+
+# day -> factory of {part: reference(path) -> answer}, the slow per-item
+# implementations the registered Solvers are checked against
+REFERENCES: Dict[str, Callable[[], Dict[str, Callable]]] = {
+    "2023/day1": _calibration_reference,
+    "2023/day5": _almanac_reference,
+    "2025/day1": _dial_reference,
+    "2025/day2": _id_ranges_reference,
+    "2025/day3": _digit_grid_reference,
+    "2025/day4": _roll_grid_reference,
+    "2025/day5": _ingredient_reference,
+}
+
+
+def compare(day: str, sizes: List[int], seed: int = 0, workdir: Optional[Path] = None) -> List[dict]:
+    """Solve generated inputs with the day's registered Solver and with its
+    reference implementations, one record per size and part."""
+    import tempfile
+
+    from aoc.registry import solver
+
+    kind, knob = DAY_FORMATS[day]
+    entry = solver(day)
+    references = REFERENCES[day]()
+    results = []
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for size in sizes:
+            input_path = write_input(kind, Path(tmp) / f"{kind}-{size}.txt", seed=seed, **{knob: size})
+            parsed = entry.load(input_path)
+            for part, reference in references.items():
+                answer, expected = getattr(entry, part)(parsed), reference(input_path)
+                results.append({"day": day, "part": part, "knob": knob, "size": size,
+                                "answer": answer, "reference": expected, "ok": answer == expected})
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import inspect
+    import json
+
+    parser = argparse.ArgumentParser(description="Generate synthetic puzzle inputs")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for kind, generator in GENERATORS.items():
+        gen_parser = sub.add_parser(kind, help=generator.__doc__.splitlines()[0])
+        gen_parser.add_argument("--seed", type=int, default=0)
+        gen_parser.add_argument("-o", "--output", type=Path, help="Output file (default: stdout)")
+        for name, param in inspect.signature(generator).parameters.items():
+            if name != "seed":
+                gen_parser.add_argument(f"--{name.replace('_', '-')}", dest=name,
+                                        type=type(param.default), default=param.default)
+    scale_parser = sub.add_parser("scale", help="Benchmark a day on generated inputs of growing size")
+    scale_parser.add_argument("day", choices=sorted(DAY_FORMATS))
+    scale_parser.add_argument("--sizes", type=int, nargs="+", required=True)
+    scale_parser.add_argument("--seed", type=int, default=0)
+    scale_parser.add_argument("--min-time", type=float, default=0.2)
+    scale_parser.add_argument("-o", "--output", type=Path, help="Write results as JSON to this file")
+    compare_parser = sub.add_parser("compare", help="Check a day's Solver against its reference code on generated inputs")
+    compare_parser.add_argument("day", choices=sorted(REFERENCES))
+    compare_parser.add_argument("--sizes", type=int, nargs="+", required=True)
+    compare_parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        results = compare(args.day, args.sizes, seed=args.seed)
+        for result in results:
+            status = "ok" if result["ok"] else "MISMATCH"
+            print(f"{result['knob']}={result['size']} {result['day']} {result['part']}: "
+                  f"{result['answer']} vs reference {result['reference']} {status}")
+        return 0 if all(result["ok"] for result in results) else 1
+
+    if args.command == "scale":
+        results = scale(args.day, args.sizes, seed=args.seed, min_time=args.min_time)
+        for result in results:
+            print(f"{result['knob']}={result['size']} {result['name']}: median={result['median']:.6f}s")
+        if args.output:
+            args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        return 0
+
+    knobs = {k: v for k, v in vars(args).items() if k not in ("command", "seed", "output")}
+    text = GENERATORS[args.command](seed=args.seed, **knobs)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Zero-copy character grids.
+
+The whole file is read (or memory-mapped) once and rows are exposed as
+memoryview slices / a strided NumPy view into that single buffer, so there
+is no per-cell Python object.
+"""
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+class ByteGrid:
+    """rows x cols grid of byte values backed by one contiguous buffer.
+
+    Rows sit `stride` bytes apart (cols plus the line ending). `offset` is
+    subtracted by solvers that want numeric cells, e.g. ord('0') for digit
+    grids.
+    """
+
+    def __init__(self, buffer, rows: int, cols: int, stride: int, offset: int = 0) -> None:
+        self.buffer = buffer
+        self.rows = rows
+        self.cols = cols
+        self.stride = stride
+        self.offset = offset
+        # flat byte view, also for a 2-D array buffer (e.g. a mapped aoc.binary section)
+        self._view = memoryview(buffer).cast("B")
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def row(self, i: int) -> memoryview:
+        if not 0 <= i < self.rows:
+            raise IndexError(f"row {i} out of range for {self.rows} rows")
+        start = i * self.stride
+        return self._view[start:start + self.cols]
+
+    def __getitem__(self, i: int) -> memoryview:
+        return self.row(i)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for i in range(self.rows):
+            yield self.row(i)
+
+    def array(self) -> np.ndarray:
+        """(rows, cols) uint8 view into the buffer, the line endings are skipped by the strides."""
+        return np.ndarray(shape=(self.rows, self.cols), dtype=np.uint8,
+                          buffer=self._view, strides=(self.stride, 1))
+
+    def __repr__(self) -> str:
+        return f"ByteGrid({self.rows} rows x {self.cols} cols)"
+
+
+def load_byte_grid(path: str | Path, use_mmap: bool = False, offset: int = 0) -> ByteGrid:
+    """Load a rectangular text grid without splitting it into per-cell objects.
+
+    Every line must have the same length, '\\n' and '\\r\\n' endings both work
+    and the last line may or may not end with a newline. With use_mmap=True
+    the file is memory-mapped instead of read, so pages are only touched when
+    a solver reads them.
+    """
+    p = Path(path)
+    if use_mmap and p.stat().st_size:
+        with p.open("rb") as fh:
+            buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        buffer = p.read_bytes()
+
+    size = len(buffer)
+    # ignore trailing blank lines
+    while size and buffer[size - 1] in b"\r\n":
+        size -= 1
+    if not size:
+        return ByteGrid(b"", 0, 0, 1, offset)
+
+    newline = buffer.find(b"\n", 0, size)
+    if newline == -1:
+        cols, stride = size, size + 1
+    else:
+        cols = newline - 1 if buffer[newline - 1:newline] == b"\r" else newline
+        stride = newline + 1
+    rows = (size + stride - cols) // stride
+    if (rows - 1) * stride + cols != size:
+        raise ValueError(f"Grid in {p} is not rectangular ({cols} columns in the first row)")
+    return ByteGrid(buffer, rows, cols, stride, offset)
+
+
+def load_digit_grid(path: str | Path, use_mmap: bool = False) -> ByteGrid:
+    """ByteGrid of a digit file, cell values are digits + ord('0')."""
+    return load_byte_grid(path, use_mmap=use_mmap, offset=ord("0"))
@@ -0,0 +1,200 @@
+"""Opt-in instrumentation: per-phase wall time and memory, hot-helper call
+counts, GC pauses, peak RSS, plus an optional cProfile dump.
+
+Off by default and then free: phase() hands back one shared no-op context
+manager and counted() returns the function itself, so nothing sits on the
+hot path. It is switched on with AOC_PROFILE=1 (read at import, so it covers
+day scripts run directly) or by calling enable() before the day modules are
+imported, which is what `python -m aoc --profile out.json` (or `--profile -` for
+stderr) does.
+
+    with phase("parse"):
+        grid = load_grid(path)
+
+    @counted
+    def find_max_range(row, start, end): ...
+
+With AOC_PROFILE=1 the report goes to stderr at exit, or as JSON to
+AOC_PROFILE_OUT, and AOC_PROFILE_PSTATS=file.pstats also records cProfile
+for flamegraph tools (e.g. snakeviz, flameprof).
+"""
+import os
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+_enabled = False
+_profiler = None
+_stack: List["_Phase"] = []
+_phases: Dict[str, dict] = {}
+_calls: Counter = Counter()
+_gc = {"collections": [0, 0, 0], "seconds": 0.0, "_started": None}
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("name", "start", "start_bytes", "start_blocks", "child_peak")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self):
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        if _stack:
+            # reset_peak below forgets the parent's peak so far, keep it
+            _stack[-1].child_peak = max(_stack[-1].child_peak, peak)
+        tracemalloc.reset_peak()
+        self.start_bytes = current
+        self.start_blocks = sys.getallocatedblocks()
+        self.child_peak = 0
+        _stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        import tracemalloc
+
+        elapsed = time.perf_counter() - self.start
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, self.child_peak)
+        _stack.pop()
+        if _stack:
+            _stack[-1].child_peak = max(_stack[-1].child_peak, peak)
+        stats = _phases.setdefault(self.name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                               "peak_bytes": 0, "net_bytes": 0, "net_blocks": 0})
+        stats["calls"] += 1
+        stats["seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        stats["peak_bytes"] = max(stats["peak_bytes"], peak - self.start_bytes)
+        stats["net_bytes"] += current - self.start_bytes
+        stats["net_blocks"] += sys.getallocatedblocks() - self.start_blocks
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def phase(name: str):
+    """Context manager timing a named phase (totals accumulate over repeated entries)."""
+    return _Phase(name) if _enabled else _NULL
+
+
+def counted(func: Callable) -> Callable:
+    """Count calls of a hot helper. Decided at decoration time: when off, func is returned as is."""
+    if not _enabled:
+        return func
+    import functools
+
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _calls[name] += 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _gc_callback(stage: str, info: dict) -> None:
+    if stage == "start":
+        _gc["_started"] = time.perf_counter()
+    elif _gc["_started"] is not None:
+        _gc["seconds"] += time.perf_counter() - _gc["_started"]
+        _gc["collections"][info["generation"]] += 1
+        _gc["_started"] = None
+
+
+def enable(pstats_path: Optional[str] = None) -> None:
+    """Start recording. Helpers decorated before this call stay uncounted."""
+    global _enabled, _profiler
+    import gc
+    import tracemalloc
+
+    if _enabled:
+        return
+    _enabled = True
+    tracemalloc.start()
+    gc.callbacks.append(_gc_callback)
+    if pstats_path:
+        import cProfile
+
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes, None where resource is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # Linux reports KiB
+
+
+def report() -> dict:
+    import tracemalloc
+
+    traced = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    return {
+        "phases": _phases,
+        "calls": dict(_calls.most_common()),
+        "gc": {"collections": list(_gc["collections"]), "seconds": _gc["seconds"]},
+        "peak_rss_bytes": peak_rss(),
+        "traced_bytes": {"current": traced[0], "peak_since_last_phase": traced[1]},
+    }
+
+
+def format_report(data: dict) -> str:
+    lines = ["phase                          calls     total s       max s     peak KiB   net blocks"]
+    for name, stats in data["phases"].items():
+        lines.append(f"{name:<30} {stats['calls']:>5} {stats['seconds']:>11.6f} {stats['max_seconds']:>11.6f} "
+                     f"{stats['peak_bytes'] / 1024:>12.1f} {stats['net_blocks']:>12}")
+    for name, count in data["calls"].items():
+        lines.append(f"calls {name}: {count}")
+    gc_stats = data["gc"]
+    lines.append(f"gc: {sum(gc_stats['collections'])} collections {gc_stats['collections']}, "
+                 f"{gc_stats['seconds']:.6f}s")
+    if data["peak_rss_bytes"] is not None:
+        lines.append(f"peak RSS: {data['peak_rss_bytes'] / 2 ** 20:.1f} MiB")
+    return "\n".join(lines)
+
+
+def finish(json_path: Optional[str] = None, pstats_path: Optional[str] = None) -> dict:
+    """Stop cProfile and write the outputs asked for. Without json_path the report goes to stderr."""
+    global _profiler
+    data = report()
+    if _profiler is not None and pstats_path:
+        _profiler.disable()
+        _profiler.dump_stats(pstats_path)
+        _profiler = None
+    if json_path:
+        import json
+
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    else:
+        print(format_report(data), file=sys.stderr)
+    return data
+
+
+if os.environ.get("AOC_PROFILE") == "1":
+    import atexit
+
+    enable(os.environ.get("AOC_PROFILE_PSTATS"))
+    atexit.register(finish, os.environ.get("AOC_PROFILE_OUT"), os.environ.get("AOC_PROFILE_PSTATS"))
@@ -0,0 +1,108 @@
+"""Sorted interval index for integer range membership.
+
+Ranges are anything with inclusive .start/.end attributes (the Range
+dataclasses in 2025 day2 and day5 both qualify), a RangeColumns or an
+(n, 2) NumPy array such as a mapped aoc.binary section. An array is merged
+and queried with NumPy and never turned into Python ints.
+"""
+from bisect import bisect_right
+from typing import Iterable, List, Tuple
+
+from aoc.lazy import lazy_import
+from aoc.records import range_bounds
+
+np = lazy_import("numpy")
+
+
+def merge_pairs(pairs: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Sort (start, end) pairs and merge overlapping or touching ones."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(pairs):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def merge_array(ranges):
+    """merge_pairs for an (n, 2) int64 array, returns the (starts, ends) arrays."""
+    if not len(ranges):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    ordered = ranges[np.argsort(ranges[:, 0], kind="stable")]
+    starts, ends = ordered[:, 0], np.maximum.accumulate(ordered[:, 1])
+    # a range opens a new interval when it starts past everything before it
+    opens = np.ones(len(starts), dtype=bool)
+    opens[1:] = starts[1:] > ends[:-1] + 1
+    first = np.flatnonzero(opens)
+    last = np.append(first[1:] - 1, len(starts) - 1)
+    return starts[first], ends[last]
+
+
+class IntervalSet:
+    """Merged, disjoint ranges stored as flat sorted start/end lists.
+
+    A single membership test is one bisect, a batch of values is answered
+    with one sort and a merge sweep over the intervals.
+    """
+
+    def __init__(self, ranges: Iterable) -> None:
+        if getattr(ranges, "ndim", None) == 2:
+            self.starts, self.ends = merge_array(ranges)
+            return
+        merged = merge_pairs(range_bounds(ranges))
+        self.starts: List[int] = [start for start, _ in merged]
+        self.ends: List[int] = [end for _, end in merged]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return bool(i >= 0 and value <= self.ends[i])
+
+    def total_length(self) -> int:
+        """Number of integers covered by the set."""
+        if not isinstance(self.starts, list):
+            return int((self.ends - self.starts + 1).sum())
+        return sum(end - start + 1 for start, end in zip(self.starts, self.ends))
+
+    def max_end(self) -> int:
+        return int(self.ends[-1])
+
+    def contains_many(self, values: Iterable[int]) -> List[bool]:
+        """Membership of every value, in the order given.
+
+        A NumPy array of values (or a set built from an array) is answered
+        with one searchsorted and gives a bool array.
+        """
+        if hasattr(values, "dtype") or not isinstance(self.starts, list):
+            return self._contains_array(np.asarray(values if hasattr(values, "dtype") else list(values),
+                                                   dtype=np.int64))
+        values = list(values)
+        found = [False] * len(values)
+        starts, ends = self.starts, self.ends
+        i, n = 0, len(starts)
+        for pos in sorted(range(len(values)), key=values.__getitem__):
+            value = values[pos]
+            while i < n and ends[i] < value:
+                i += 1
+            if i == n:
+                break
+            found[pos] = starts[i] <= value
+        return found
+
+    def _contains_array(self, values):
+        starts = np.asarray(self.starts, dtype=np.int64)
+        ends = np.asarray(self.ends, dtype=np.int64)
+        if not len(starts):
+            return np.zeros(len(values), dtype=bool)
+        i = np.searchsorted(starts, values, side="right") - 1
+        return (i >= 0) & (values <= ends[np.maximum(i, 0)])
+
+    def count_contained(self, values: Iterable[int]) -> int:
+        found = self.contains_many(values)
+        return int(found.sum()) if hasattr(found, "sum") else sum(found)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(zip(map(int, self.starts), map(int, self.ends)))})"
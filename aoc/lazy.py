@@ -0,0 +1,31 @@
+"""Deferred imports for heavy optional dependencies.
+
+`np = lazy_import("numpy")` binds a stand-in that imports the real module on
+first attribute access, so a day module used only for its pure-Python path
+never pays NumPy's ~70ms import. Modules doing this put
+`from __future__ import annotations` first, otherwise the `np.ndarray`
+annotations would trigger the import at definition time.
+"""
+import importlib
+
+
+class LazyModule:
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
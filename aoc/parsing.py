@@ -0,0 +1,64 @@
+"""Byte-level NumPy helpers for parsing numeric puzzle inputs without
+creating a Python object per token, and a line-aligned chunked reader."""
+from __future__ import annotations
+
+from functools import cache
+from typing import BinaryIO, Callable, Iterator, Optional
+
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+@cache
+def powers_of_10() -> np.ndarray:
+    """10**0 .. 10**18 as int64, built on first use so importing stays NumPy-free."""
+    return 10 ** np.arange(19, dtype=np.int64)
+
+
+def digit_runs(buf: np.ndarray):
+    """Find every run of ASCII digits in a uint8 buffer and its integer value.
+
+    Returns (run_starts, run_ends, values), run_ends being exclusive. Runs
+    longer than 18 digits would overflow int64 and raise ValueError.
+    """
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    lengths = run_ends - run_starts
+    if not len(lengths):
+        return run_starts, run_ends, np.zeros(0, dtype=np.int64)
+    if lengths.max() > 18:
+        raise ValueError("Number too long to fit in int64")
+
+    digit_pos = np.flatnonzero(is_digit)
+    exponents = np.repeat(run_ends, lengths) - 1 - digit_pos
+    weighted = (buf[digit_pos] - ord("0")).astype(np.int64) * powers_of_10()[exponents]
+    values = np.add.reduceat(weighted, np.cumsum(lengths) - lengths)
+    return run_starts, run_ends, values
+
+
+def line_chunks(fh: BinaryIO, chunk_size: int = 1 << 22,
+                wait: Optional[Callable[[], bool]] = None) -> Iterator[bytes]:
+    """Yield a binary file roughly chunk_size bytes at a time, cut after the last complete line.
+
+    The partial line at the end of a read is carried over to the next one.
+    At end of file wait, if given, is called: True reads again (the file may
+    have grown, as with tail -f), False stops. A trailing line without a
+    newline comes last, unless it is only whitespace.
+    """
+    pending = b""
+    while True:
+        chunk = fh.read(chunk_size)
+        if not chunk:
+            if wait is not None and wait():
+                continue
+            break
+        data = pending + chunk
+        cut = data.rfind(b"\n") + 1
+        pending = data[cut:]
+        if cut:
+            yield data[:cut]
+    if pending.strip():
+        yield pending
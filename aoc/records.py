@@ -0,0 +1,42 @@
+"""Struct-of-arrays record containers.
+
+Instead of one dataclass instance per record, every field lives in its own
+typed array (8 bytes per int64 value, no per-record __dict__ or GC header).
+"""
+from array import array
+from typing import Iterable, Iterator, Tuple
+
+
+class RangeColumns:
+    """Inclusive integer ranges stored as two int64 arrays."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: Iterable[int] = (), ends: Iterable[int] = ()) -> None:
+        self.starts = array("q", starts)
+        self.ends = array("q", ends)
+        if len(self.starts) != len(self.ends):
+            raise ValueError("starts and ends must have the same length")
+
+    def append(self, start: int, end: int) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def bounds(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __repr__(self) -> str:
+        return f"RangeColumns({len(self)} ranges)"
+
+
+def range_bounds(ranges) -> Iterator[Tuple[int, int]]:
+    """(start, end) pairs from a RangeColumns, an (n, 2) array or any iterable of .start/.end records."""
+    if isinstance(ranges, RangeColumns):
+        return ranges.bounds()
+    if getattr(ranges, "ndim", None) == 2:
+        # NumPy rows, e.g. a memory-mapped aoc.binary section, as Python ints
+        return map(tuple, ranges.tolist())
+    return ((r.start, r.end) for r in ranges)
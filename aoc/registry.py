@@ -0,0 +1,353 @@
+"""One entry point for every day's load/part1/part2.
+
+Each day registers a factory that imports its modules by path (through
+aoc.bench.load_day_module, so sibling imports like `from game import *`
+resolve) and returns the callables to run. The 2023 scripts that solve at
+import time are never imported, their entries point at the library modules
+next to them instead. Inputs are resolved relative to the day directory, so
+nothing depends on the working directory.
+
+Solvers may also give pack/unpack functions turning their parsed input into
+a dict of NumPy arrays and back, which is what aoc.cache stores and what
+aoc.binary compiles inputs to. An --input in that binary format is mapped
+and unpacked instead of parsed.
+
+    python -m aoc                     # every registered day, one process
+    python -m aoc 2023/day5 2025/day4 -j 4   # one pool task per day-part
+    python -m aoc --cache             # reuse answers and parses of unchanged inputs
+    python -m aoc --profile out.json --pstats out.pstats   # see aoc.instrument
+    python -m aoc 2025/day3 --profile -                    # report to stderr
+"""
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from aoc.bench import ROOT, load_day_module
+from aoc.grids import ByteGrid, load_digit_grid
+from aoc.instrument import phase
+from aoc.lazy import lazy_import
+from aoc.records import RangeColumns
+
+np = lazy_import("numpy")
+
+PARTS = ("part1", "part2")
+
+
+class Solver(NamedTuple):
+    """load(path) -> parsed, part1/part2(parsed) -> answer.
+
+    Both parts get the same parsed object, which may be a read-only view
+    of a mapped file, so solvers must not modify it.
+    """
+    load: Callable
+    part1: Callable
+    part2: Callable
+    pack: Optional[Callable] = None
+    unpack: Optional[Callable] = None
+
+
+class Entry(NamedTuple):
+    day: str
+    input: str
+    factory: Callable[[], Solver]
+
+    @property
+    def default_input(self) -> Path:
+        return ROOT / self.day / self.input
+
+
+class TaskResult(NamedTuple):
+    day: str
+    part: str
+    answer: object
+    load_seconds: float
+    solve_seconds: float
+    cached: bool = False
+
+    @property
+    def seconds(self) -> float:
+        return self.load_seconds + self.solve_seconds
+
+
+REGISTRY: Dict[str, Entry] = {}
+_SOLVERS: Dict[str, Solver] = {}
+
+
+def register(day: str, input: str):
+    """Decorator adding a Solver factory for day, input is the file name in the day directory."""
+    def wrap(factory: Callable[[], Solver]) -> Callable[[], Solver]:
+        REGISTRY[day] = Entry(day, input, factory)
+        return factory
+    return wrap
+
+
+def _module(day: str, name: str):
+    return load_day_module(ROOT / day / name)
+
+
+def solver(day: str) -> Solver:
+    """The day's Solver, built (and its modules imported) on first use."""
+    if day not in _SOLVERS:
+        _SOLVERS[day] = REGISTRY[day].factory()
+    return _SOLVERS[day]
+
+
+@register("2023/day1", "d1p1.txt")
+def _calibration() -> Solver:
+    d1 = _module("2023/day1", "d1.py")
+    return Solver(Path.read_bytes,
+                  lambda data: d1.calibration_sum(data, words=False),
+                  lambda data: d1.calibration_sum(data, words=True))
+
+
+@register("2023/day2", "d2.txt")
+def _cube_game() -> Solver:
+    game = _module("2023/day2", "game.py")
+    return Solver(game.load_games,
+                  lambda parsed: game.possible_games_sum(*parsed),
+                  lambda parsed: game.power_sum(parsed[1]),
+                  pack=lambda parsed: {"game_ids": parsed[0], "maxima": parsed[1]},
+                  unpack=lambda arrays: (arrays["game_ids"], arrays["maxima"]))
+
+
+@register("2023/day3", "d3.txt")
+def _engine_schematic() -> Solver:
+    schematic = _module("2023/day3", "schematic.py")
+    return Solver(lambda path: schematic.Schematic(path.read_text().splitlines()),
+                  lambda grid: grid.part_number_sum(),
+                  lambda grid: grid.gear_ratio_sum())
+
+
+@register("2023/day4", "d4.txt")
+def _scratchcards() -> Solver:
+    card = _module("2023/day4", "card.py")
+    return Solver(card.load_deck, card.deck_score, card.total_copies,
+                  pack=lambda matches: {"matches": matches},
+                  unpack=lambda arrays: arrays["matches"])
+
+
+@register("2023/day5", "d5.txt")
+def _almanac() -> Solver:
+    d5 = _module("2023/day5", "d5.py")
+
+    def load(path):
+        intervals, seeds, mapping_list = d5.read_file(path)
+        return intervals, seeds, d5.compose_mappings(mapping_list)
+
+    def pack(parsed):
+        # the raw seeds line and the composed map's (dest, src, len) rows,
+        # the per-stage maps are only needed to build it
+        _, seeds, composed = parsed
+        return {"seeds": np.array(seeds, dtype=np.int64),
+                "nodes": np.array(composed.triples(), dtype=np.int64).reshape(-1, 3)}
+
+    def unpack(arrays):
+        seeds = arrays["seeds"].tolist()
+        return d5.seed_pairs(seeds), seeds, d5.Mapping.from_triples("seed-to-location map:", arrays["nodes"])
+
+    return Solver(load,
+                  lambda parsed: min(map(parsed[2].find_mapping, parsed[1])),
+                  lambda parsed: min(start for start, _ in parsed[2].map_intervals(parsed[0])),
+                  pack=pack, unpack=unpack)
+
+
+@register("2025/day1", "input.txt")
+def _dial() -> Solver:
+    d1 = _module("2025/day1", "d1.py")
+    return Solver(d1.load_signed_moves, d1.part1, d1.part2,
+                  pack=lambda deltas: {"deltas": _narrow(deltas)},
+                  unpack=lambda arrays: arrays["deltas"])
+
+
+@register("2025/day2", "input.txt")
+def _invalid_ids() -> Solver:
+    d2 = _module("2025/day2", "d2.py")
+    util = _module("2025/day2", "util.py")
+    return Solver(util.load_range_columns, d2.part1, d2.part2,
+                  pack=lambda columns: {"ranges": _column_pairs(columns)},
+                  unpack=lambda arrays: arrays["ranges"])
+
+
+@register("2025/day3", "input.txt")
+def _joltage() -> Solver:
+    d3 = _module("2025/day3", "d3.py")
+    # digit values (0-9) are packed, the mapped array is handed back as a
+    # ByteGrid over the same buffer, so no per-cell object is ever made
+    return Solver(load_digit_grid, d3.part1, d3.part2,
+                  pack=lambda grid: {"grid": grid.array() - np.uint8(grid.offset)},
+                  unpack=lambda arrays: ByteGrid(arrays["grid"], *arrays["grid"].shape, arrays["grid"].shape[1]))
+
+
+@register("2025/day4", "input.txt")
+def _paper_rolls() -> Solver:
+    d4 = _module("2025/day4", "d4.py")
+    return Solver(d4.load_array, d4.part1, d4.part2,
+                  pack=lambda rolls: {"rolls": rolls},
+                  unpack=lambda arrays: arrays["rolls"])
+
+
+@register("2025/day5", "input.txt")
+def _fresh_ingredients() -> Solver:
+    d5 = _module("2025/day5", "d5.py")
+    return Solver(d5.load_columns,
+                  lambda parsed: d5.part1(*parsed),
+                  lambda parsed: d5.part2(parsed[0]),
+                  pack=lambda parsed: {"ranges": _column_pairs(parsed[0]),
+                                       "values": np.array(parsed[1], dtype=np.int64)},
+                  unpack=lambda arrays: (arrays["ranges"], arrays["values"]))
+
+
+def _load(day: str, input_path: Path, cache, key: Optional[str]):
+    """Parse input_path, from the cache's packed arrays when it has them.
+
+    A compiled aoc.binary input is mapped and unpacked directly.
+    """
+    from aoc.binary import is_binary, load_sections
+
+    entry = solver(day)
+    if is_binary(input_path):
+        if entry.unpack is None:
+            raise ValueError(f"{day} cannot read binary inputs")
+        return entry.unpack(load_sections(input_path))
+    if cache is not None and entry.unpack is not None:
+        arrays = cache.arrays(key)
+        if arrays is not None:
+            return entry.unpack(arrays)
+    parsed = entry.load(input_path)
+    if cache is not None and entry.pack is not None:
+        try:
+            cache.store_arrays(key, entry.pack(parsed))
+        except (OverflowError, ValueError):  # e.g. values past int64, ragged grid
+            pass
+    return parsed
+
+
+def _solve_day(day: str, parts, input_path: Optional[Path], cache=None) -> List[TaskResult]:
+    entry = solver(day)
+    input_path = Path(input_path or REGISTRY[day].default_input)
+    key = cache.key(day, input_path) if cache is not None else None
+    known = cache.answers(key) if cache is not None else {}
+    results = [TaskResult(day, part, known[part], 0.0, 0.0, cached=True) for part in parts if part in known]
+    missing = [part for part in parts if part not in known]
+    if missing:
+        t0 = time.perf_counter()
+        with phase(f"{day} load"):
+            parsed = _load(day, input_path, cache, key)
+        load_seconds = time.perf_counter() - t0
+        for part in missing:
+            t1 = time.perf_counter()
+            with phase(f"{day} {part}"):
+                answer = getattr(entry, part)(parsed)
+            results.append(TaskResult(day, part, answer, load_seconds, time.perf_counter() - t1))
+        if cache is not None:
+            cache.store_answers(key, day, {result.part: result.answer for result in results})
+    return sorted(results, key=lambda result: parts.index(result.part))
+
+
+def _column_pairs(columns: RangeColumns):
+    """RangeColumns as an (n, 2) int64 array of inclusive (start, end) rows."""
+    return np.column_stack((np.frombuffer(columns.starts, dtype=np.int64),
+                            np.frombuffer(columns.ends, dtype=np.int64)))
+
+
+def _narrow(values):
+    """values in the smallest signed integer dtype that holds them (int8 for short moves)."""
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if not len(values) or (values.min() >= info.min and values.max() <= info.max):
+            return values.astype(dtype)
+    return values
+
+
+def run_task(day: str, part: str, input_path: Optional[Path] = None,
+             cache_options: Optional[Tuple[Path, int]] = None) -> TaskResult:
+    """Load and solve one day-part from scratch, the unit of work for a pool worker.
+
+    cache_options is (directory, max_bytes) of the caller's ResultCache, if any.
+    """
+    cache = None
+    if cache_options is not None:
+        from aoc.cache import ResultCache
+
+        cache = ResultCache(*cache_options)
+    return _solve_day(day, (part,), input_path, cache)[0]
+
+
+def run_days(days: List[str], parts=PARTS, inputs: Optional[Dict[str, Path]] = None, cache=None) -> List[TaskResult]:
+    """Run every day-part in this process, parsing each input once per day."""
+    inputs = inputs or {}
+    results = []
+    for day in days:
+        results += _solve_day(day, tuple(parts), inputs.get(day), cache)
+    return results
+
+
+def run_parallel(days: List[str], parts=PARTS, inputs: Optional[Dict[str, Path]] = None,
+                 processes: Optional[int] = None, cache=None) -> List[TaskResult]:
+    """One pool task per day-part. Each task parses its own input, so load time is per task here."""
+    from multiprocessing import Pool
+
+    inputs = inputs or {}
+    cache_options = (cache.directory, cache.max_bytes) if cache is not None else None
+    tasks = [(day, part, inputs.get(day), cache_options) for day in days for part in parts]
+    with Pool(processes) as pool:
+        return pool.starmap(run_task, tasks, chunksize=1)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run any set of days from one interpreter")
+    parser.add_argument("days", nargs="*", help=f"Days to run (default: all of {', '.join(REGISTRY)})")
+    parser.add_argument("--part", choices=PARTS, action="append", help="Only this part (repeatable)")
+    parser.add_argument("--input", type=Path, help="Input file (only with a single day)")
+    parser.add_argument("-j", "--processes", type=int, default=0,
+                        help="Run on a process pool of this size, one task per day-part (default: in-process)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse answers and parsed inputs of unchanged inputs (also AOC_CACHE=1)")
+    parser.add_argument("--cache-dir", type=Path, help="Cache directory (default: AOC_CACHE_DIR or .aoc-cache)")
+    parser.add_argument("--cache-size", type=float, default=256, help="Cache size limit in MiB")
+    parser.add_argument("--profile", metavar="JSON",
+                        help="Record per-phase time, memory and helper call counts; write JSON here ('-' for stderr)")
+    parser.add_argument("--pstats", metavar="FILE", help="Also dump a cProfile of the run to FILE (implies --profile)")
+    args = parser.parse_args(argv)
+
+    days = args.days or list(REGISTRY)
+    unknown = [day for day in days if day not in REGISTRY]
+    if unknown:
+        parser.error(f"unknown day(s): {', '.join(unknown)}")
+    if args.input and len(days) != 1:
+        parser.error("--input needs exactly one day")
+    inputs = {days[0]: args.input} if args.input else None
+    parts = tuple(args.part) if args.part else PARTS
+    if args.profile not in (None, "-") and (args.profile in REGISTRY or Path(args.profile).is_dir()):
+        parser.error(f"--profile takes a JSON file to write ('-' for stderr), not {args.profile!r}")
+    profiling = args.profile is not None or args.pstats is not None
+    if profiling:
+        if args.processes:
+            parser.error("--profile records this process only, drop -j")
+        from aoc import instrument
+
+        # before any day module is imported, so @counted helpers get wrapped
+        instrument.enable(args.pstats)
+    cache = None
+    if args.cache or os.environ.get("AOC_CACHE") == "1":
+        from aoc.cache import ResultCache
+
+        cache = ResultCache(args.cache_dir, int(args.cache_size * 1024 * 1024))
+
+    t0 = time.perf_counter()
+    if args.processes:
+        results = run_parallel(days, parts, inputs, args.processes, cache)
+    else:
+        results = run_days(days, parts, inputs, cache)
+    total = time.perf_counter() - t0
+
+    for result in results:
+        timing = "cached" if result.cached else f"load {result.load_seconds:.4f}s, solve {result.solve_seconds:.4f}s"
+        print(f"{result.day} {result.part}: {result.answer} ({timing})")
+    print(f"wall time: {total:.4f}s")
+    if profiling:
+        instrument.finish(None if args.profile in (None, "-") else args.profile, args.pstats)
+    return 0
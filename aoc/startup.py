@@ -0,0 +1,111 @@
+"""Cold-start cost of every day module.
+
+Each day's Solver is built in a fresh interpreter (importing its modules
+without parsing or solving anything) and the wall time over an interpreter
+that only imports aoc.registry is reported, so the registry's own import is
+not charged to every day. Alongside it come the heavy optional dependencies
+that got pulled in and the slowest top-level imports from -X importtime
+that the baseline does not already make.
+
+    python -m aoc.startup                  # every registered day
+    python -m aoc.startup --budget 50      # exit 1 if a day costs more than 50ms
+"""
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+from aoc.bench import ROOT
+
+# anything here showing up in a plain import means a lazy import regressed
+HEAVY = ("numpy", "tqdm", "multiprocessing", "argparse", "statistics", "timeit")
+
+BASELINE = "import aoc.registry"
+
+PROBE = """
+import sys
+from aoc.registry import solver
+solver({day!r})
+print(','.join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def _wall(code: str, repeats: int) -> float:
+    """Best of repeats, the minimum is the least noisy estimate of a cold start."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        _run(code)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def top_level_imports(importtime_log: str) -> List[tuple]:
+    """(module, cumulative ms) of every top-level import in an -X importtime log."""
+    entries = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # nested imports are indented further
+            entries.append((name.strip(), int(cumulative) / 1000))
+    return entries
+
+
+def slowest_imports(importtime_log: str, top: int = 3, exclude=()) -> List[tuple]:
+    """The top slowest top-level imports, skipping module names in exclude."""
+    entries = [entry for entry in top_level_imports(importtime_log) if entry[0] not in exclude]
+    return sorted(entries, key=lambda entry: entry[1], reverse=True)[:top]
+
+
+def baseline_modules() -> set:
+    """Top-level modules the baseline interpreter imports by itself."""
+    return {name for name, _ in top_level_imports(_run(BASELINE).stderr)}
+
+
+def measure_day(day: str, baseline: float, repeats: int = 5, exclude=()) -> dict:
+    code = PROBE.format(day=day, heavy=HEAVY)
+    probe = _run(code)
+    return {
+        "day": day,
+        "ms": max(0.0, _wall(code, repeats) - baseline) * 1000,
+        "heavy": [name for name in probe.stdout.strip().split(",") if name],
+        "slowest": slowest_imports(probe.stderr, exclude=exclude),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    from aoc.registry import REGISTRY
+
+    parser = argparse.ArgumentParser(description="Report the cold-start import cost of each day")
+    parser.add_argument("days", nargs="*", help="Days to check (default: all registered)")
+    parser.add_argument("--budget", type=float, help="Fail if a day's import costs more than this many ms")
+    parser.add_argument("--repeats", type=int, default=5, help="Interpreter starts per measurement")
+    args = parser.parse_args(argv)
+
+    baseline = _wall(BASELINE, args.repeats)
+    exclude = baseline_modules()
+    print(f"interpreter + aoc.registry: {baseline * 1000:.1f}ms")
+    over = []
+    for day in args.days or list(REGISTRY):
+        result = measure_day(day, baseline, args.repeats, exclude)
+        slowest = ", ".join(f"{name} {ms:.1f}ms" for name, ms in result["slowest"])
+        heavy = ", ".join(result["heavy"]) or "none"
+        print(f"{day}: +{result['ms']:.1f}ms  heavy: {heavy}  slowest: {slowest}")
+        if args.budget is not None and result["ms"] > args.budget:
+            over.append(day)
+    if over:
+        print(f"over the {args.budget:g}ms budget: {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# the day scripts are not a package, tests import them with
+# aoc.bench.load_day_module and need the repo root for `aoc` itself
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,41 @@
+import pytest
+
+from aoc.bench import ROOT, load_day_module
+from aoc.generators import calibration
+
+d1 = load_day_module(ROOT / "2023" / "day1" / "d1.py")
+
+LINES = ["eightwo", "twone3", "oneight", "sevenine", "xtwone3four", "7pqrstsixteen",
+         "nodigits", "", "zoneight234", "1", "threeight"]
+
+
+def replace_sum(lines):
+    # the str.replace original has no answer for a line without digits, those count 0
+    return d1.calibration_sum_replace([line for line in lines
+                                       if any(c.isdigit() for c in line) or any(word in line for word in d1.WORDS)])
+
+
+def test_overlapping_words():
+    assert d1.calibration_value(b"eightwo") == 82
+    assert d1.calibration_value(b"twone3") == 23
+    assert d1.calibration_value(b"oneight") == 18
+    assert d1.calibration_value(b"nodigits") == 0
+    assert d1.calibration_value(b"eightwo", words=False) == 0
+
+
+def test_value_per_line_matches_replace():
+    for line in LINES:
+        assert d1.calibration_value(line.encode()) == replace_sum([line])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8, 64, 1 << 24])
+def test_sum_and_file_match_replace(tmp_path, chunk_size):
+    for text in ["\n".join(LINES) + "\n", "\n".join(LINES), calibration(seed=0, lines=300)]:
+        lines = text.splitlines()
+        expected = replace_sum(lines)
+        assert d1.calibration_sum(text.encode()) == expected
+        path = tmp_path / "calibration.txt"
+        path.write_text(text)
+        assert d1.calibration_sum_file(path, chunk_size=chunk_size) == expected
+        assert d1.calibration_sum_file(path, words=False, chunk_size=chunk_size) == \
+            sum(d1.calibration_value(line.encode(), words=False) for line in lines)
@@ -0,0 +1,38 @@
+import random
+
+from aoc.bench import ROOT, load_day_module
+from aoc.generators import game_records
+
+game = load_day_module(ROOT / "2023" / "day2" / "game.py")
+
+
+def game_maxima(text):
+    """(ids, per-colour maxima) from the Game/Turn objects, 0 for a colour never shown."""
+    games = [game.Game(line) for line in text.splitlines() if line.strip()]
+    maxima = [[max((turn.colors.get(color, 0) for turn in current.turns), default=0)
+               for color in game.COLORS] for current in games]
+    return [current.game_id for current in games], maxima
+
+
+def check(text):
+    ids, maxima = game.parse_games(text.encode())
+    assert (ids.tolist(), maxima.tolist()) == game_maxima(text)
+
+
+def test_untracked_colours_are_ignored():
+    ids, maxima = game.parse_games(b"Game 1: 3 rabbits, 2 red\n")
+    assert maxima.tolist() == [[0, 2, 0]]
+    for text in ["Game 1: 3 rabbits, 2 red\n", "Game 2: 5 greens, 1 green; 4 bluebells\n",
+                 "Game 3: 7 gold, 1 blue; 2 reddish, 3 red\nGame 4: 9 brown", "Game 5: 4 blue"]:
+        check(text)
+
+
+def test_parse_games_matches_game_objects():
+    rng = random.Random(0)
+    words = ["rabbits", "gold", "brown", "reddish", "greens"]
+    for seed in range(5):
+        lines = game_records(seed=seed, games=50).splitlines()
+        # slip an untracked colour into some turns
+        lines = [line.replace(", ", f", {rng.randint(1, 30)} {rng.choice(words)}, ", 1) if rng.random() < 0.5 else line
+                 for line in lines]
+        check("\n".join(lines) + "\n")
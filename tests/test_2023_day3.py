@@ -0,0 +1,20 @@
+from aoc.bench import ROOT, load_day_module
+
+schematic = load_day_module(ROOT / "2023" / "day3" / "schematic.py")
+
+
+def test_equal_part_numbers_are_counted_separately():
+    grid = schematic.Schematic(["5*5", "...", "5+."])
+    assert grid.part_number_sum() == 15
+    assert grid.gear_ratio_sum() == 25
+
+
+def test_gear_with_two_equal_numbers_in_a_row():
+    grid = schematic.Schematic(["12.12", "..*..", "....."])
+    assert grid.part_number_sum() == 24
+    assert grid.gear_ratio_sum() == 144
+
+
+def test_example():
+    grid = schematic.Schematic((ROOT / "2023" / "day3" / "d3e.txt").read_text().splitlines())
+    assert (grid.part_number_sum(), grid.gear_ratio_sum()) == (4361, 467835)
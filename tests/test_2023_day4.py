@@ -0,0 +1,47 @@
+from aoc.bench import ROOT, load_day_module
+from aoc.generators import scratchcards
+
+card = load_day_module(ROOT / "2023" / "day4" / "card.py")
+
+
+def card_matches(text):
+    return [card.Card(line).calculate_points() for line in text.splitlines() if line.strip()]
+
+
+def test_deck_matches_matches_cards():
+    for seed in range(3):
+        text = scratchcards(seed=seed, cards=100, winning=10, mine=25, max_number=40)
+        assert card.deck_matches(text.encode()).tolist() == card_matches(text)
+
+
+def test_large_numbers_use_sets():
+    text = ("Card 1: 1000000000 5 | 1000000000 5 7\n"
+            "Card 2: 3 4 | 1000000000 4\n"
+            "Card 3: 99 | 1\n")
+    assert card.deck_matches(text.encode()).tolist() == card_matches(text) == [2, 1, 0]
+    text = scratchcards(seed=4, cards=50, max_number=10 ** 6)
+    assert card.deck_matches(text.encode()).tolist() == card_matches(text)
+
+
+def per_card_copies(matches):
+    """The original nested loop, with the span clamped to the deck."""
+    cards_found = [1] * len(matches)
+    for i, card_matches in enumerate(matches):
+        for j in range(i + 1, min(i + 1 + card_matches, len(matches))):
+            cards_found[j] += cards_found[i]
+    return sum(cards_found)
+
+
+def test_total_copies_clamps_at_deck_end():
+    assert card.total_copies([5, 0, 0]) == 5
+    assert card.total_copies([0, 0, 3]) == 3
+    assert card.total_copies([]) == 0
+
+
+def test_total_copies_matches_per_card_loop():
+    for seed in range(3):
+        # many matches per card, so the last cards' spans run past the deck
+        matches = card.deck_matches(scratchcards(seed=seed, cards=120, winning=10, mine=25,
+                                                 max_number=30).encode())
+        assert matches[-5:].any()
+        assert card.total_copies(matches) == per_card_copies(matches.tolist())
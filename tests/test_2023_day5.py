@@ -0,0 +1,43 @@
+import pytest
+
+from aoc.bench import ROOT, load_day_module
+from aoc.generators import almanac
+
+d5 = load_day_module(ROOT / "2023" / "day5" / "d5.py")
+
+LIMIT = 1000
+
+
+def small_almanac(tmp_path, seed):
+    # small enough that every seed and every number below LIMIT can be pushed through play_game
+    path = tmp_path / f"almanac-{seed}.txt"
+    path.write_text(almanac(seed=seed, seed_ranges=4, maps=4, nodes=6, width=60, limit=LIMIT))
+    return d5.read_file(path)
+
+
+def expand(intervals):
+    return {number for start, end in intervals for number in range(start, end + 1)}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_map_intervals_matches_play_game(tmp_path, seed):
+    intervals, _, mapping_list = small_almanac(tmp_path, seed)
+    expected = {d5.play_game(number, mapping_list) for number in expand(intervals)}
+    assert expand(d5.play_game_ranges(intervals, mapping_list)) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compose_mappings_matches_play_game(tmp_path, seed):
+    intervals, _, mapping_list = small_almanac(tmp_path, seed)
+    composed = d5.compose_mappings(mapping_list)
+    for number in range(LIMIT + 50):
+        assert composed.find_mapping(number) == d5.play_game(number, mapping_list)
+    expected = {d5.play_game(number, mapping_list) for number in expand(intervals)}
+    assert expand(composed.map_intervals(intervals)) == expected
+
+
+def test_composed_triples_round_trip(tmp_path):
+    _, _, mapping_list = small_almanac(tmp_path, 0)
+    composed = d5.compose_mappings(mapping_list)
+    rebuilt = d5.Mapping.from_triples(composed.name, composed.triples())
+    assert (rebuilt.starts, rebuilt.offsets) == (composed.starts, composed.offsets)
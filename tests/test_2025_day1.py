@@ -0,0 +1,37 @@
+import pytest
+
+from aoc.bench import ROOT, load_day_module
+from aoc.generators import dial_moves
+
+d1 = load_day_module(ROOT / "2025" / "day1" / "d1.py")
+
+# landing on zero, leaving zero to the left, whole turns either way
+EDGE_CASES = "L50\nL100\nR100\nR1\nL1\nL200\nR250\nL49\nL1\nR300\n"
+
+
+def write(tmp_path, text):
+    path = tmp_path / "moves.txt"
+    path.write_text(text)
+    return path
+
+
+@pytest.mark.parametrize("text", [EDGE_CASES] + [dial_moves(seed=seed, count=2000, max_distance=350)
+                                                 for seed in range(3)])
+def test_floor_division_crossings_match_scan(tmp_path, text):
+    path = write(tmp_path, text)
+    moves, deltas = d1.load_moves(path), d1.load_signed_moves(path)
+    assert d1.part1(deltas) == d1.part1_scan(moves)
+    assert d1.part2(deltas) == d1.part2_scan(moves)
+
+
+def test_stream_matches_batch(tmp_path):
+    path = write(tmp_path, dial_moves(seed=4, count=3000))
+    deltas = d1.load_signed_moves(path)
+    for state in (d1.solve_stream(path, chunk_size=1000), d1.solve_stream(path, chunked=False)):
+        assert (state.part1, state.part2, state.moves) == (d1.part1(deltas), d1.part2(deltas), len(deltas))
+
+
+@pytest.mark.parametrize("data", [b"L\n", b"R", b"R5\nL\n", b"5\n", b"X12\n"])
+def test_malformed_moves_raise_value_error(data):
+    with pytest.raises(ValueError):
+        d1.parse_signed_moves(data)
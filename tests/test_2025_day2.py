@@ -0,0 +1,64 @@
+import random
+
+from aoc.bench import ROOT, load_day_module
+
+d2 = load_day_module(ROOT / "2025" / "day2" / "d2.py")
+
+
+def brute_force(start, end, repeated):
+    numbers = [number for number in range(start, end + 1) if repeated(str(number))]
+    return len(numbers), sum(numbers)
+
+
+def twice(number):
+    return d2.detect_repeat(number)
+
+
+def any_times(number):
+    return bool(d2.detect_repeat_updated(number))
+
+
+def check(start, end):
+    assert d2.count_repeats(start, end, only_twice=True) == brute_force(start, end, twice)
+    assert d2.count_repeats(start, end) == brute_force(start, end, any_times)
+
+
+def test_count_repeats_small_ranges():
+    for start, end in [(1, 1), (1, 9), (11, 11), (1, 99), (95, 115), (998, 1012), (1, 120000)]:
+        check(start, end)
+
+
+def test_count_repeats_around_block_boundaries():
+    # 6 digits: period 1, 2 and 3 blocks overlap at 111111, 222222, ...
+    for start, end in [(111110, 111112), (222220, 222224), (121211, 121213), (999990, 1000010),
+                       (1188511880, 1188511890), (446443, 446449)]:
+        check(start, end)
+
+
+def test_count_repeats_random_ranges():
+    rng = random.Random(0)
+    for _ in range(200):
+        start = rng.randrange(1, 10 ** rng.randint(1, 8))
+        check(start, start + rng.randrange(3000))
+
+
+def test_parts_match_scans():
+    rng = random.Random(1)
+    ranges = []
+    for _ in range(20):
+        start = rng.randrange(1, 10 ** 7)
+        ranges.append(d2.Range(start, start + rng.randrange(5000)))
+    assert d2.part1(ranges) == d2.part1_scan(ranges)
+    assert d2.part2(ranges) == d2.part2_scan(ranges)
+
+
+def test_generated_ranges_match_scans_and_reach_part2():
+    from aoc.generators import compare
+
+    results = compare("2025/day2", [50, 500])
+    assert all(result["ok"] for result in results)
+    by_size = {}
+    for result in results:
+        by_size.setdefault(result["size"], {})[result["part"]] = result["answer"]
+    # ids with three or more repeats only count in part 2
+    assert all(answers["part1"] != answers["part2"] for answers in by_size.values())
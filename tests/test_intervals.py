@@ -0,0 +1,39 @@
+import random
+
+import numpy as np
+
+from aoc.intervals import IntervalSet, merge_pairs
+from aoc.records import RangeColumns
+
+
+def random_ranges(rng, count, limit):
+    ranges = []
+    for _ in range(count):
+        start = rng.randrange(limit)
+        ranges.append((start, start + rng.randrange(limit // 20)))
+    return ranges
+
+
+def test_array_set_matches_pair_set():
+    rng = random.Random(0)
+    for count in (0, 1, 5, 200):
+        pairs = random_ranges(rng, count, 10 ** 4)
+        values = [rng.randrange(-5, 10 ** 4 + 5) for _ in range(500)]
+        from_pairs = IntervalSet(RangeColumns([s for s, _ in pairs], [e for _, e in pairs]))
+        from_array = IntervalSet(np.array(pairs, dtype=np.int64).reshape(-1, 2))
+
+        merged = merge_pairs(pairs)
+        assert list(zip(from_array.starts.tolist(), from_array.ends.tolist())) == merged
+        assert from_array.total_length() == from_pairs.total_length()
+        expected = from_pairs.contains_many(values)
+        assert from_array.contains_many(np.array(values)).tolist() == expected
+        assert from_pairs.contains_many(np.array(values)).tolist() == expected
+        assert from_array.count_contained(values) == sum(expected)
+        assert [value in from_array for value in values] == expected
+
+
+def test_touching_ranges_merge():
+    ranges = np.array([[5, 7], [1, 3], [4, 4], [10, 12], [11, 11]], dtype=np.int64)
+    index = IntervalSet(ranges)
+    assert (index.starts.tolist(), index.ends.tolist()) == ([1, 10], [7, 12])
+    assert index.total_length() == 10
@@ -0,0 +1,33 @@
+import io
+
+from aoc.parsing import line_chunks
+
+
+def test_line_chunks_cut_at_line_ends():
+    data = b"L68\nR30\nR48\n\nL5\nR60"
+    for chunk_size in (1, 2, 3, 5, 64):
+        chunks = list(line_chunks(io.BytesIO(data), chunk_size))
+        assert b"".join(chunks) == data
+        assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+
+
+def test_line_chunks_drops_whitespace_tail_and_empty_file():
+    assert list(line_chunks(io.BytesIO(b"a\nb\n  "), 3)) == [b"a\n", b"b\n"]
+    assert list(line_chunks(io.BytesIO(b""))) == []
+
+
+def test_line_chunks_wait_reads_again():
+    fh = io.BytesIO(b"a\nb")
+    appended = []
+
+    def wait():
+        if appended:
+            return False
+        appended.append(True)
+        position = fh.tell()
+        fh.seek(0, io.SEEK_END)
+        fh.write(b"c\nd\n")
+        fh.seek(position)
+        return True
+
+    assert list(line_chunks(fh, 64, wait)) == [b"a\n", b"bc\nd\n"]